@@ -1,9 +1,10 @@
 from datetime import datetime
 from typing import Annotated
 
-from fastapi import APIRouter, Depends, HTTPException, Security, status
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Security, status
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import selectinload
 
 from cctracker.db import models, with_db
 from cctracker.log import get_logger
@@ -21,54 +22,52 @@ api_router = APIRouter(prefix="/admin", tags=["admin"])
 
 @api_router.get("/permission-requests")
 async def list_permission_requests(
-    _user: Annotated[models.UserData, Security(CurrentUser, scopes=["admin"])],
+    _user: Annotated[models.UserData, Security(CurrentUser(), scopes=["admin"])],
     db: Annotated[AsyncSession, Depends(with_db)],
 ) -> list[PermissionRequestResponse]:
     """List all pending permission requests"""
-    log.info(f"Admin {_user.username} fetching permission requests")
+    log.info("Admin %s fetching permission requests", _user.username)
 
+    # project just the response columns, skipping full ORM hydration
     stmt = (
-        select(models.PermissionRequest)
+        select(
+            models.UserData.username,
+            models.PermissionRequest.grant_type,
+            models.PermissionRequest.status,
+            models.PermissionRequest.requested_at,
+            models.PermissionRequest.reason,
+        )
+        .select_from(models.PermissionRequest)
         .join(models.UserData)
         .order_by(models.PermissionRequest.requested_at)
     )
-    results = await db.scalars(stmt)
-
-    requests = []
-    for req in results:
-        user = await req.awaitable_attrs.user
-        requests.append(
-            PermissionRequestResponse(
-                username=user.username,
-                grant_type=req.grant_type,
-                status=req.status,
-                requested_at=req.requested_at,
-                reason=req.reason,
-            )
-        )
+    rows = (await db.execute(stmt)).mappings().all()
+
+    requests = [PermissionRequestResponse(**row) for row in rows]
 
-    log.info(f"Returning {len(requests)} permission requests")
+    log.info("Returning %s permission requests", len(requests))
     return requests
 
 
 @api_router.post("/grant-permission/")
 async def grant_permission(
     details: PermissionRequestBase,
-    admin_user: Annotated[models.UserData, Security(CurrentUser, scopes=["admin"])],
+    admin_user: Annotated[models.UserData, Security(CurrentUser(), scopes=["admin"])],
     db: Annotated[AsyncSession, Depends(with_db)],
 ):
     """Grant permission and remove request (manual Keycloak grant required)"""
-    log.info(f"Admin {admin_user.username} granting permission to {details.username}")
+    log.info("Admin %s granting permission to %s", admin_user.username, details.username)
 
     stmt = (
         select(models.PermissionRequest)
         .join(models.UserData)
         .where(models.UserData.username == details.username)
+        .options(selectinload(models.PermissionRequest.user))
     )
     request = await db.scalar(stmt)
 
     if not request:
-        log.warning(f"Permission request not found for {details.username}")
+        log.warning("Permission request not found for %s", details.username)
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND, detail="Permission request not found"
         )
@@ -77,9 +76,9 @@ async def grant_permission(
     request.granted_by = admin_user.username
     await db.commit()
 
-    log.info(f"Permission granted to {details.username} by {admin_user.username}")
+    log.info("Permission granted to %s by %s", details.username, admin_user.username)
     return PermissionRequestResponse(
-        username=user.username,
+        username=request.user.username,
         grant_type=details.grant_type,
         status=PermissionRequestStatus.GRANTED,
         requested_at=request.requested_at,
@@ -87,15 +86,32 @@ async def grant_permission(
     )
 
 
+async def _mark_denied(request_id: int) -> None:
+    """Apply the denial outside the request with its own session.
+
+    Request-scoped sessions are torn down before background tasks run, so
+    the update needs a fresh one.
+    """
+    async for db in with_db():
+        request = await db.get(models.PermissionRequest, request_id)
+        if request is None:
+            log.warning("Permission request %s vanished before denial", request_id)
+            return
+        request.status = PermissionRequestStatus.DENIED
+        await db.commit()
+
+
 @api_router.delete("/deny-permission/{username}")
 async def deny_permission(
     username: str,
-    admin_user: Annotated[models.UserData, Security(CurrentUser, scopes=["admin"])],
+    background_tasks: BackgroundTasks,
+    admin_user: Annotated[models.UserData, Security(CurrentUser(), scopes=["admin"])],
     db: Annotated[AsyncSession, Depends(with_db)],
 ):
     """Deny and delete permission request"""
-    log.info(f"Admin {admin_user.username} denying permission for {username}")
+    log.info("Admin %s denying permission for %s", admin_user.username, username)
 
+    # no .user access on the deny path, so skip the relationship load
     stmt = (
         select(models.PermissionRequest)
         .join(models.UserData)
@@ -104,15 +120,15 @@ async def deny_permission(
     request = await db.scalar(stmt)
 
     if not request:
-        log.warning(f"Permission request not found for {username}")
+        log.warning("Permission request not found for %s", username)
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND, detail="Permission request not found"
         )
 
-    request.status = PermissionRequestStatus.DENIED
-    await db.commit()
+    # a denial doesn't need read-after-write, so commit after the response
+    background_tasks.add_task(_mark_denied, request.id)
 
-    log.info(f"Permission denied for {username} by {admin_user.username}")
+    log.info("Permission denied for %s by %s", username, admin_user.username)
     return PermissionRequestResponse(
         username=username,
         grant_type=request.grant_type,
@@ -1,17 +1,26 @@
+import asyncio
 import hashlib
-from io import BytesIO
 import magic
 
 from typing import Annotated
-from fastapi import APIRouter, Cookie, Depends, HTTPException, UploadFile, status
+from fastapi import (
+    APIRouter,
+    BackgroundTasks,
+    Cookie,
+    Depends,
+    HTTPException,
+    Response,
+    UploadFile,
+    status,
+)
 from itsdangerous.exc import BadSignature
 from minio import Minio
-from sqlalchemy import select
-from sqlalchemy.orm import selectinload
+from sqlalchemy import bindparam, select
+from sqlalchemy.orm import joinedload, selectinload
 from sqlalchemy.ext.asyncio import AsyncSession
 from valkey.asyncio import Valkey
 
-from cctracker.cache import with_vk
+from cctracker.cache import artist_details_cache_key, with_vk
 from cctracker.db import with_db, models
 from cctracker.fs.core import ALLOWED_IMAGE_TYPES, MAX_FILE_SIZE, with_bucket
 from cctracker.log import get_logger
@@ -23,45 +32,69 @@ from cctracker.models.artists import (
 from cctracker.server.auth import verify as dc_verify
 from cctracker.server.config import config
 from cctracker.server.helpers import CurrentUser, OptionalUser
-from cctracker.server.seat_expiration_helper import expire_stale_seats
+from cctracker.server.seat_expiration_helper import (
+    expire_stale_seats_background,
+)
 
 _log = get_logger(__name__)
 
 api_router = APIRouter(prefix="/artist", tags=["artist operations"])
 
+_ARTIST_CACHE_TTL = 30  # seconds
+
+
+# Built once so SQLAlchemy can reuse the compiled forms across requests.
+# Each statement loads only what its endpoint actually reads.
+_ARTIST_FULL_STMT = (
+    select(models.Artist)
+    .where(models.Artist.slug == bindparam("slug"))
+    .options(
+        selectinload(models.Artist.assignments),
+        joinedload(models.Artist.event),
+    )
+)
+_ARTIST_ONLY_STMT = select(models.Artist).where(models.Artist.slug == bindparam("slug"))
+_ARTIST_WITH_EVENT_STMT = (
+    select(models.Artist)
+    .where(models.Artist.slug == bindparam("slug"))
+    .options(joinedload(models.Artist.event))
+)
+
 
 @api_router.get("/{artistId}")
 async def get_artist(
     artistId: str,
+    response: Response,
+    background_tasks: BackgroundTasks,
     db: Annotated[AsyncSession, Depends(with_db)],
     vk: Annotated[Valkey, Depends(with_vk)],
 ):
     """
     Gets the general information about the provided {artistId}, and returns an Artist model.
     """
-    _log.debug(f"get artist called: {artistId}")
-
-    stmt = (
-        select(models.Artist)
-        .where(models.Artist.slug == artistId)
-        .options(
-            selectinload(models.Artist.assignments),
-            selectinload(models.Artist.event),
-        )
-    )
-    artist = await db.scalar(stmt)
+    _log.debug("get artist called: %s", artistId)
+
+    response.headers["Cache-Control"] = f"public, max-age={_ARTIST_CACHE_TTL}"
+
+    cached = await vk.get(artist_details_cache_key(artistId))
+    if cached is not None:
+        _log.debug("artist cache hit for %s", artistId)
+        return Artist.model_validate_json(cached)
+
+    artist = await db.scalar(_ARTIST_FULL_STMT, {"slug": artistId})
 
     if artist is None:
-        _log.warning(f"{artistId} requested, but not found")
+        _log.warning("%s requested, but not found", artistId)
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND, detail=f"{artistId} not found"
         )
 
-    await expire_stale_seats(artist.event, db, vk)
+    # don't tie read latency to the expiration sweep; run it after the response
+    background_tasks.add_task(expire_stale_seats_background, artist.event.slug)
 
     time_remaining = artist.time_remaining
 
-    return Artist(
+    artist_details = Artist(
         name=artist.name,
         slug=artist.slug,
         eventId=artist.event.slug,
@@ -75,6 +108,14 @@ async def get_artist(
         timeSinceLastAssignment=artist.time_since_last_assignment
     )
 
+    await vk.set(
+        artist_details_cache_key(artistId),
+        artist_details.model_dump_json(),
+        ex=_ARTIST_CACHE_TTL,
+    )
+
+    return artist_details
+
 
 @api_router.post("/{artistId}")
 async def update_artist(
@@ -84,6 +125,7 @@ async def update_artist(
     event_artist_token: Annotated[str, Cookie()],
     user_data: Annotated[models.UserData | None, Depends(OptionalUser)],
     db: Annotated[AsyncSession, Depends(with_db)],
+    vk: Annotated[Valkey, Depends(with_vk)],
 ):
     """
     If the current user has the correct cookie, they can update the temporary listing of their seat, or profile for the event.
@@ -110,18 +152,10 @@ async def update_artist(
             detail="event id mismatch in token and submitted details",
         )
 
-    stmt = (
-        select(models.Artist)
-        .where(models.Artist.slug == artistId)
-        .options(
-            selectinload(models.Artist.assignments),
-            selectinload(models.Artist.event),
-        )
-    )
-    artist = await db.scalar(stmt)
+    artist = await db.scalar(_ARTIST_ONLY_STMT, {"slug": artistId})
 
     if artist is None:
-        _log.warning(f"{artistId} requested, but not found")
+        _log.warning("%s requested, but not found", artistId)
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND, detail=f"{artistId} not found"
         )
@@ -132,8 +166,6 @@ async def update_artist(
     artist.coms_open = artistDetails.commissionsOpen
     artist.coms_remaining = artistDetails.commissionsRemaining
 
-    await db.commit()
-
     if saveDetails and user_data:
         if user_data.artist_data is None:
             user_data.artist_data = models.UserArtistData()
@@ -142,7 +174,9 @@ async def update_artist(
         user_data.artist_data.profileUrl = artist.profileUrl
         user_data.artist_data.details = artist.details
 
-        await db.commit()
+    # single unit of work for both the event artist and the saved profile
+    await db.commit()
+    await vk.delete(artist_details_cache_key(artistId))
 
 
 @api_router.post("/{artistId}/profile_picture")
@@ -153,23 +187,16 @@ async def upload_artist_profile_picture(
     user_data: Annotated[models.UserData | None, Depends(OptionalUser)],
     db: Annotated[AsyncSession, Depends(with_db)],
     minio: Annotated[Minio, Depends(with_bucket)],
+    vk: Annotated[Valkey, Depends(with_vk)],
 ):
     """
     Update the artist profile picture.
     If they are logged in, update the user profile picture as well.
     """
-    stmt = (
-        select(models.Artist)
-        .where(models.Artist.slug == artistId)
-        .options(
-            selectinload(models.Artist.assignments),
-            selectinload(models.Artist.event),
-        )
-    )
-    artist = await db.scalar(stmt)
+    artist = await db.scalar(_ARTIST_WITH_EVENT_STMT, {"slug": artistId})
 
     if artist is None:
-        _log.warning(f"{artistId} requested, but not found")
+        _log.warning("%s requested, but not found", artistId)
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND, detail=f"{artistId} not found"
         )
@@ -194,39 +221,46 @@ async def upload_artist_profile_picture(
             detail="File too large (max 5MB)",
         )
 
-    content = bytearray()
-    chunk_size = 1024 * 1024  # 1MB chunk
+    # libmagic only needs the header, no reason to buffer the whole file
+    header = await file.read(4096)
 
-    while chunk := await file.read(chunk_size):
-        content.extend(chunk)
-        if len(content) > MAX_FILE_SIZE:
-            raise HTTPException(
-                status_code=status.HTTP_413_CONTENT_TOO_LARGE,
-                detail="File too large (max 5MB)",
-            )
-
-    mime_types = magic.from_buffer(bytes(content), mime=True)
+    mime_types = magic.from_buffer(header, mime=True)
     if mime_types not in ALLOWED_IMAGE_TYPES:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail=f"Invalid image type. Allowed types: {', '.join(ALLOWED_IMAGE_TYPES.keys())}",
         )
 
+    # UploadFile spools to disk, so seeking gives the true size without
+    # holding the payload in memory
+    file.file.seek(0, 2)
+    file_size = file.file.tell()
+    file.file.seek(0)
+
+    if file_size > MAX_FILE_SIZE:
+        raise HTTPException(
+            status_code=status.HTTP_413_CONTENT_TOO_LARGE,
+            detail="File too large (max 5MB)",
+        )
+
     file_ext = ALLOWED_IMAGE_TYPES[mime_types]
 
     if user_data:
         object_name = f"profiles/{user_data.username}.{file_ext}"
     else:
-        hash = hashlib.sha256(f"{artist.event.slug}:{artistId}".encode()).hexdigest()[
-            :16
-        ]
-        object_name = f"profiles/temp_{hash}.{file_ext}"
-
-    _ = minio.put_object(
+        # rows created before temp_object_prefix existed fall back to deriving it
+        temp_prefix = artist.temp_object_prefix or hashlib.blake2b(
+            f"{artist.event.slug}:{artistId}".encode(), digest_size=8
+        ).hexdigest()
+        object_name = f"profiles/temp_{temp_prefix}.{file_ext}"
+
+    # blocking network call, keep it off the event loop
+    _ = await asyncio.to_thread(
+        minio.put_object,
         bucket_name=config.minio_bucket,
         object_name=object_name,
-        data=BytesIO(content),
-        length=len(content),
+        data=file.file,
+        length=file_size,
         content_type=mime_types,
     )
 
@@ -241,11 +275,12 @@ async def upload_artist_profile_picture(
     artist.imageUrl = object_name
 
     await db.commit()
+    await vk.delete(artist_details_cache_key(artistId))
 
 
 @api_router.get("/saved_details")
 async def get_saved_artist_details(
-    user_data: Annotated[models.UserData, Depends(CurrentUser)],
+    user_data: Annotated[models.UserData, Depends(CurrentUser())],
 ):
     """
     If the user is logged in, return the details that have been saved to their account.
@@ -1,9 +1,15 @@
+import asyncio
+import hashlib
+import json
+import time
 from typing import Annotated
 from fastapi import APIRouter, Depends, HTTPException
 from fastapi.security import HTTPAuthorizationCredentials
+from valkey.asyncio import Valkey
 
+from cctracker.cache import with_vk
 from cctracker.server.config import config
-from cctracker.server.auth import AuthConfig, DevTokenRequest, DevTokenResponse, VerifyResults, create_dev_token, decode_dev_jwt, security, keycloak_openid
+from cctracker.server.auth import AuthConfig, DevTokenRequest, DevTokenResponse, VerifyResults, create_dev_token, decode_dev_jwt, decode_jwt, security, keycloak_openid
 from cctracker.log import get_logger
 
 _log = get_logger(__name__)
@@ -11,6 +17,8 @@ _log = get_logger(__name__)
 # Auth Routes
 api_router = APIRouter(prefix="/auth", tags=["auth"])
 
+_INTROSPECT_CACHE_TTL = 300  # seconds, capped by the token's remaining lifetime
+
 
 @api_router.get("/config")
 async def get_keycloak_config() -> AuthConfig:
@@ -22,6 +30,7 @@ async def get_keycloak_config() -> AuthConfig:
 @api_router.post("/verify")
 async def verify_token(
     token: Annotated[HTTPAuthorizationCredentials, Depends(security)],
+    vk: Annotated[Valkey, Depends(with_vk)],
 ):
     """Verify JWT token and return the results"""
     _log.debug("Token verification requested")
@@ -29,26 +38,57 @@ async def verify_token(
     if config.dev_mode:
         try:
             token_info = decode_dev_jwt(token.credentials)
-            _log.info(f"Dev token verified for user: {token_info.get('sub')}")
+            _log.info("Dev token verified for user: %s", token_info.get('sub'))
             return VerifyResults(user=token_info)
         except HTTPException:
             _log.debug("Dev token verification failed, trying Keycloak")
             pass
+
+    # Local signature verification against the cached Keycloak public key is
+    # pure CPU work; only fall back to remote introspection when it fails.
+    try:
+        # decode_jwt fetches the Keycloak public key over HTTPS on first use
+        payload = await asyncio.to_thread(decode_jwt, token.credentials)
+        _log.info("Token verified locally for user: %s", payload.get('sub', 'unknown'))
+        return VerifyResults(user=payload)
+    except HTTPException:
+        _log.debug("Local token verification failed, falling back to introspection")
+
+    cache_key = (
+        "introspect:" + hashlib.sha256(token.credentials.encode()).hexdigest()
+    )
+
+    cached = await vk.get(cache_key)
+    if cached is not None:
+        _log.debug("Token introspection cache hit")
+        return VerifyResults(user=json.loads(cached))
+
     try:
         # Verify token with Keycloak
         _log.debug("Verifying token with Keycloak introspection")
-        token_info: dict[str, str] = keycloak_openid.introspect(token.credentials)
+        token_info: dict[str, str] = await asyncio.to_thread(
+            keycloak_openid.introspect, token.credentials
+        )
         if not token_info.get("active"):
             _log.warning("Token verification failed: token not active")
             raise HTTPException(status_code=401, detail="Invalid token")
         _log.info(
-            f"Token verified via Keycloak for user: {token_info.get('sub', 'unknown')}"
+            "Token verified via Keycloak for user: %s",
+            token_info.get("sub", "unknown"),
         )
+
+        ttl = _INTROSPECT_CACHE_TTL
+        exp = token_info.get("exp")
+        if exp is not None:
+            ttl = min(ttl, int(exp) - int(time.time()))
+        if ttl > 0:
+            await vk.set(cache_key, json.dumps(token_info), ex=ttl)
+
         return VerifyResults(user=token_info)
     except HTTPException:
         raise
     except Exception as e:
-        _log.error(f"Token verification failed with exception: {e}")
+        _log.error("Token verification failed with exception: %s", e)
         raise HTTPException(status_code=401, detail="Token verification failed")
 
 
@@ -59,8 +99,8 @@ async def generate_dev_token(token_details: DevTokenRequest):
         _log.warning("Dev token generation attempted but dev_mode is disabled")
         raise HTTPException(status_code=404, detail="Not found")
 
-    _log.info(f"Generating dev token for user '{token_details.username}' ")
-    _log.info(f"with scopes: {token_details.scopes}")
+    _log.info("Generating dev token for user '%s' ", token_details.username)
+    _log.info("with scopes: %s", token_details.scopes)
 
     token = create_dev_token(token_details.username, token_details.scopes)
     return DevTokenResponse(access_token=token)
@@ -1,38 +1,109 @@
+import asyncio
+import hashlib
+import logging
+import hmac
 from typing import Annotated
 from uuid import uuid4
 
-from fastapi import APIRouter, Depends, HTTPException, status, Response
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, status, Response
+from fastapi.responses import ORJSONResponse
 from pydantic import BaseModel
-from sqlalchemy import select, and_
+from sqlalchemy import bindparam, delete, select, and_, update
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import load_only, raiseload, selectinload
 from valkey.asyncio import Valkey
 
 from cctracker.cache.core import ArtistSeatStatus
 from cctracker.db import with_db, models
-from cctracker.cache import with_vk
+from cctracker.cache import artist_cache_key, artist_details_cache_key, with_vk
 from cctracker.log import get_logger
 from cctracker.models.artists import ArtistCustomizableDetails, RequestNewArtist
 from cctracker.models.errors import StandardError, StandardErrorTypes
 from cctracker.server.auth import EventArtistToken, sign as dc_sign, verify as dc_verify
-from cctracker.server.helpers import CurrentUser, require_event_editor, with_event
+from cctracker.server.helpers import (
+    CurrentUser,
+    require_event_editor,
+    with_event,
+    write_limiter,
+)
 from cctracker.server.seat_expiration_helper import expire_stale_seats
 
 log = get_logger(__name__)
 
-api_router = APIRouter(prefix="/event", tags=["artist event operations"])
+api_router = APIRouter(
+    prefix="/event",
+    tags=["artist event operations"],
+    default_response_class=ORJSONResponse,
+)
 
 
-class EventArtistTokenResponse(BaseModel):
-    token: str
+# Reusable error instances; StandardError is frozen so sharing is safe
+_SEAT_TAKEN_409 = StandardError(
+    code=status.HTTP_409_CONFLICT, type=StandardErrorTypes.SEAT_TAKEN
+)
+_INVALID_SEAT_400 = StandardError(
+    code=status.HTTP_400_BAD_REQUEST, type=StandardErrorTypes.INVALID_SEAT
+)
+_SLUG_EXISTS_409 = StandardError(
+    code=status.HTTP_409_CONFLICT, type=StandardErrorTypes.SLUG_EXISTS
+)
+_ARTIST_NOT_FOUND_404 = StandardError(
+    code=status.HTTP_404_NOT_FOUND, type=StandardErrorTypes.ARTIST_NOT_FOUND
+)
+_NO_ACTIVE_SEAT_404 = StandardError(
+    code=status.HTTP_404_NOT_FOUND, type=StandardErrorTypes.NO_ACTIVE_SEAT
+)
 
 
-@api_router.post("/{eventId}/artist/new", dependencies=[Depends(expire_stale_seats)])
+# Prepared once; SQLAlchemy caches the compiled form so per-request calls
+# skip the Core compile step entirely
+_ARTIST_BY_SLUG_STMT = select(models.Artist).where(
+    models.Artist.slug == bindparam("slug"),
+    models.Artist.event_id == bindparam("event_id"),
+)
+_ARTIST_ID_ONLY_STMT = _ARTIST_BY_SLUG_STMT.options(
+    load_only(models.Artist.id), raiseload("*")
+)
+_ARTIST_WITH_ASSIGNMENTS_STMT = _ARTIST_BY_SLUG_STMT.options(
+    selectinload(models.Artist.assignments)
+)
+# claim only reads artist.id; fail fast if a lazy load sneaks in
+_ARTIST_CLAIM_STMT = _ARTIST_BY_SLUG_STMT.options(raiseload("*"))
+
+# Indexed lookup (uq_seat_event_seat_number) instead of scanning event.seats
+_SEAT_BY_NUMBER_STMT = (
+    select(models.Seat)
+    .where(
+        models.Seat.event_id == bindparam("event_id"),
+        models.Seat.seat_number == bindparam("seat_number"),
+    )
+    .options(selectinload(models.Seat.assignments))
+)
+
+
+async def _write_artist_cache(cache: Valkey, key: str, mapping: dict) -> None:
+    """Deferred cache write for freshly issued artist tokens."""
+    try:
+        # hash write and TTL in one round trip, mirroring the claim path
+        async with cache.pipeline(transaction=False) as pipe:
+            pipe.hset(key, mapping=mapping)
+            pipe.expire(key, 86400 * 7)
+            await pipe.execute()
+    except Exception as e:
+        log.warning("Deferred cache write for %s failed: %s", key, e)
+
+
+@api_router.post(
+    "/{eventId}/artist/new",
+    dependencies=[Depends(write_limiter), Depends(expire_stale_seats)],
+)
 async def create_new_artist(
     details: RequestNewArtist,
     response: Response,
+    background_tasks: BackgroundTasks,
     event: Annotated[models.Event, Depends(require_event_editor)],
-    user_data: Annotated[models.UserData, Depends(CurrentUser)],
+    user_data: Annotated[models.UserData, Depends(CurrentUser())],
     db: Annotated[AsyncSession, Depends(with_db)],
     cache: Annotated[Valkey, Depends(with_vk)],
 ):
@@ -41,13 +112,12 @@ async def create_new_artist(
     The artist will be assigned a seat, as soon as the token is validated at /{eventId}/artist/claim
     """
 
-    log.info(f"{event.slug}/artist/new_artist called by {user_data.username}")
-    log.debug(f"{details.model_dump()}")
+    log.info("%s/artist/new_artist called by %s", event.slug, user_data.username)
+    if log.isEnabledFor(logging.DEBUG):
+        log.debug("%s", details.model_dump())
 
-    if event.slug not in [
-        editable_event.slug for editable_event in user_data.editable_events
-    ]:
-        log.debug(f"{user_data.username} can not edit {event.slug}")
+    if event.slug not in user_data.editable_event_slugs:
+        log.debug("%s can not edit %s", user_data.username, event.slug)
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="You do not have permission to edit this event.",
@@ -56,70 +126,69 @@ async def create_new_artist(
     wanted_seat: models.Seat | None = None
     if details.seat:
         log.debug("Trying to add to a seat")
-        for seat in event.seats:
-            if seat.seat_number == details.seat:
-                if seat.current_artist:
-                    log.debug("Seat already taken, returning")
-                    response.status_code = status.HTTP_409_CONFLICT
-                    return StandardError(
-                        code=status.HTTP_409_CONFLICT,
-                        type=StandardErrorTypes.SEAT_TAKEN,
-                    )
-                else:
-                    wanted_seat = seat
-                break
+        wanted_seat = await db.scalar(
+            _SEAT_BY_NUMBER_STMT,
+            {"event_id": event.id, "seat_number": details.seat},
+        )
+        if wanted_seat is not None and wanted_seat.current_artist:
+            log.debug("Seat already taken, returning")
+            response.status_code = status.HTTP_409_CONFLICT
+            return _SEAT_TAKEN_409
 
     if wanted_seat is None:
         log.debug("Seat requested does not exist")
         response.status_code = status.HTTP_400_BAD_REQUEST
-        return StandardError(
-            code=status.HTTP_400_BAD_REQUEST, type=StandardErrorTypes.INVALID_SEAT
-        )
-
-    artist_stmt = select(models.Artist).where(
-        (models.Artist.slug == details.slug)
-        & (models.Artist.event_id == details.eventId)
-    )
-    artist_exists = await db.scalar(artist_stmt)
-
-    if artist_exists:
-        log.debug("Artist slug already exists")
-        response.status_code = status.HTTP_409_CONFLICT
-        return StandardError(
-            code=status.HTTP_409_CONFLICT, type=StandardErrorTypes.SLUG_EXISTS
-        )
+        return _INVALID_SEAT_400
 
     new_artist = models.Artist(
         name=details.name,
         slug=details.slug,
+        temp_object_prefix=hashlib.blake2b(
+            artist_cache_key(event.slug, details.slug).encode(), digest_size=8
+        ).hexdigest(),
     )
 
     event.artists.append(new_artist)
     db.add(new_artist)
 
-    await db.commit()
+    # let the (event_id, slug) unique constraint catch duplicates instead of
+    # pre-checking with an extra SELECT; also closes the check-then-insert race
+    try:
+        await db.commit()
+    except IntegrityError:
+        await db.rollback()
+        log.debug("Artist slug already exists")
+        response.status_code = status.HTTP_409_CONFLICT
+        return _SLUG_EXISTS_409
 
-    log.info(f"Artist ({details.name}) assigned to {details.slug} for {event.slug}")
+    log.info("Artist (%s) assigned to %s for %s", details.name, details.slug, event.slug)
 
     event_artist_token = EventArtistToken(
         event_id=event.slug, artist_id=details.slug, uuid=uuid4()
     )
 
-    log.debug(f"new artist token: {event_artist_token}")
+    log.debug("new artist token: %s", event_artist_token)
 
-    _ = await cache.hset(
-        f"{event.slug}:{details.slug}",
-        mapping={
+    # the caller doesn't need the cache write to land before it gets the
+    # token; defer it so the response isn't gated on the Valkey round trip
+    background_tasks.add_task(
+        _write_artist_cache,
+        cache,
+        artist_cache_key(event.slug, details.slug),
+        {
             "status": ArtistSeatStatus.pending_creation,
             "seat": wanted_seat.seat_number,
-            "token_uuid": event_artist_token.uuid,
+            "token_uuid": event_artist_token.uuid.hex,
             "locked": "0",
         },
     )
 
-    log.debug(f"Returning token, pending artist acceptance.")
+    log.debug("Returning token, pending artist acceptance.")
 
-    return EventArtistTokenResponse(token=dc_sign(event_artist_token, salt=event.slug))
+    # HMAC signing is CPU-bound; keep it off the event loop
+    token = await asyncio.to_thread(dc_sign, event_artist_token, salt=event.slug)
+    # plain dict: orjson serializes it directly, skipping a model round trip
+    return {"token": token}
 
 
 @api_router.get(
@@ -127,23 +196,23 @@ async def create_new_artist(
 )
 async def recreate_artist_token(
     artistId: str,
+    background_tasks: BackgroundTasks,
     event: Annotated[models.Event, Depends(require_event_editor)],
-    user_data: Annotated[models.UserData, Depends(CurrentUser)],
+    user_data: Annotated[models.UserData, Depends(CurrentUser())],
     db: Annotated[AsyncSession, Depends(with_db)],
     cache: Annotated[Valkey, Depends(with_vk)],
 ):
     """
     Recreate a token for an existing artist.
     """
-    log.info(f"{event.slug}/tokens/{artistId} called by {user_data.username}")
+    log.info("%s/tokens/%s called by %s", event.slug, artistId, user_data.username)
 
-    artist_stmt = select(models.Artist).where(
-        (models.Artist.slug == artistId) & (models.Artist.event_id == event.id)
+    artist = await db.scalar(
+        _ARTIST_ID_ONLY_STMT, {"slug": artistId, "event_id": event.id}
     )
-    artist = await db.scalar(artist_stmt)
 
     if not artist:
-        log.debug(f"Artist {artistId} not found")
+        log.debug("Artist %s not found", artistId)
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND, detail=f"Artist {artistId} not found"
         )
@@ -152,16 +221,23 @@ async def recreate_artist_token(
         event_id=event.slug, artist_id=artistId, uuid=uuid4()
     )
 
-    log.debug(f"Recreated artist token: {event_artist_token}")
+    log.debug("Recreated artist token: %s", event_artist_token)
 
-    _ = await cache.hset(
-        f"{event.slug}:{artistId}",
-        mapping={"token_uuid": event_artist_token.uuid},
+    # deferred like the create path; also refreshes the 7-day TTL so the
+    # reissued token doesn't outlive its cache entry
+    background_tasks.add_task(
+        _write_artist_cache,
+        cache,
+        artist_cache_key(event.slug, artistId),
+        {"token_uuid": event_artist_token.uuid.hex},
     )
 
-    log.info(f"Token recreated for artist {artistId} in {event.slug}")
+    log.info("Token recreated for artist %s in %s", artistId, event.slug)
 
-    return EventArtistTokenResponse(token=dc_sign(event_artist_token, salt=event.slug))
+    # HMAC signing is CPU-bound; keep it off the event loop
+    token = await asyncio.to_thread(dc_sign, event_artist_token, salt=event.slug)
+    # plain dict: orjson serializes it directly, skipping a model round trip
+    return {"token": token}
 
 
 @api_router.get("/{eventId}/artist/claim", dependencies=[Depends(expire_stale_seats)])
@@ -176,39 +252,50 @@ async def claim_artist_seat(
     Artist claims their seat using the token provided by event organizer.
     Sets the token as a cookie for future requests.
     """
-    log.info(f"{event.slug}/artist/claim called with token")
+    log.info("%s/artist/claim called with token", event.slug)
 
     try:
-        token_data = dc_verify(token, salt=event.slug)
+        token_data = await asyncio.to_thread(dc_verify, token, salt=event.slug)
     except Exception as e:
-        log.warning(f"Invalid token signature: {e}")
+        log.warning("Invalid token signature: %s", e)
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid or expired token"
         )
 
     artist_id = token_data.artist_id
-    cache_key = f"{event.slug}:{artist_id}"
+    cache_key = artist_cache_key(event.slug, artist_id)
+
+    # the cache and DB lookups are independent, so overlap their round trips;
+    # only the two fields this handler reads come over the socket
+    (cached_uuid, cached_seat), artist = await asyncio.gather(
+        cache.hmget(cache_key, "token_uuid", "seat"),
+        db.scalar(_ARTIST_CLAIM_STMT, {"slug": artist_id, "event_id": event.id}),
+    )
 
-    cached_data = await cache.hgetall(cache_key)
+    expected_uuid = token_data.uuid.hex.encode()
+    if cached_uuid is None:
+        # tokens live 7 days: entries written before the hash-tagged key and
+        # hex-uuid format landed are still in flight, so fall back to the
+        # legacy key, which stored the dashed uuid form
+        cached_uuid, cached_seat = await cache.hmget(
+            f"{event.slug}:{artist_id}", "token_uuid", "seat"
+        )
+        expected_uuid = str(token_data.uuid).encode()
 
-    if not cached_data:
-        log.warning(f"No cached data for {cache_key}")
+    if cached_uuid is None:
+        log.warning("No cached data for %s", cache_key)
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND, detail="Artist assignment not found"
         )
 
-    if cached_data.get("token_uuid") != str(token_data.uuid):
-        log.warning(f"Token UUID mismatch for {artist_id}")
+    # hmget returns bytes (the client is not in decode_responses mode)
+    if not hmac.compare_digest(cached_uuid, expected_uuid):
+        log.warning("Token UUID mismatch for %s", artist_id)
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Token has been invalidated",
         )
 
-    artist_stmt = select(models.Artist).where(
-        (models.Artist.slug == artist_id) & (models.Artist.event_id == event.id)
-    )
-    artist = await db.scalar(artist_stmt)
-
     if not artist:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -216,13 +303,15 @@ async def claim_artist_seat(
         )
 
     try:
-        seat_number = int(cached_data.get("seat", 0))
+        seat_number = int(cached_seat or 0)
     except (ValueError, TypeError):
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Invalid seat data in cache",
         )
-    seat = next((s for s in event.seats if s.seat_number == seat_number), None)
+    seat = await db.scalar(
+        _SEAT_BY_NUMBER_STMT, {"event_id": event.id, "seat_number": seat_number}
+    )
 
     if not seat:
         raise HTTPException(
@@ -243,9 +332,15 @@ async def claim_artist_seat(
         )
         db.add(assignment)
         await db.commit()
-        log.info(f"Artist {artist_id} claimed seat {seat_number} in {event.slug}")
+        log.info("Artist %s claimed seat %s in %s", artist_id, seat_number, event.slug)
 
-    await cache.hset(cache_key, "status", ArtistSeatStatus.active)
+    # one round trip for the status write, the TTL matching the cookie, and
+    # the details eviction (claiming changes active/seat/timeRemaining)
+    async with cache.pipeline(transaction=False) as pipe:
+        pipe.hset(cache_key, "status", ArtistSeatStatus.active)
+        pipe.expire(cache_key, 86400 * 7)
+        pipe.delete(artist_details_cache_key(artist_id))
+        await pipe.execute()
 
     response.set_cookie(
         key="event_artist_token",
@@ -255,7 +350,7 @@ async def claim_artist_seat(
         max_age=86400 * 7,  # 7 days
     )
 
-    log.info(f"Token set as cookie for artist {artist_id}")
+    log.info("Token set as cookie for artist %s", artist_id)
     return True
 
 
@@ -263,26 +358,37 @@ class ArtistEventLock(BaseModel):
     locked: bool
 
 
-@api_router.post("/{eventId}/artist/{artistId}/lock")
+# Check-and-set in one atomic call instead of an HGET + HSET pair
+_SET_LOCKED_SCRIPT = """
+if redis.call('HEXISTS', KEYS[1], 'locked') == 0 then
+  return -1
+end
+redis.call('HSET', KEYS[1], 'locked', ARGV[1])
+return 1
+"""
+
+
+@api_router.post(
+    "/{eventId}/artist/{artistId}/lock", dependencies=[Depends(write_limiter)]
+)
 async def set_artist_locked_for_event(
     artistId: str,
     lockStatus: ArtistEventLock,
     event: Annotated[models.Event, Depends(require_event_editor)],
-    _user_data: Annotated[models.UserData, Depends(CurrentUser)],
+    _user_data: Annotated[models.UserData, Depends(CurrentUser())],
     cache: Annotated[Valkey, Depends(with_vk)],
 ):
 
-    cache_key = f"{event.slug}:{artistId}"
+    cache_key = artist_cache_key(event.slug, artistId)
 
-    cached_data = await cache.hget(cache_key, "locked")
+    set_locked = cache.register_script(_SET_LOCKED_SCRIPT)
+    result = await set_locked(keys=[cache_key], args=[int(lockStatus.locked)])
 
-    if cached_data is None:
+    if result == -1:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND, detail="Artist not in cache"
         )
 
-    _ = await cache.hset(cache_key, "locked", int(lockStatus.locked))
-
     return lockStatus
 
 
@@ -290,11 +396,11 @@ async def set_artist_locked_for_event(
 async def get_artist_locked_status_for_event(
     artistId: str,
     event: Annotated[models.Event, Depends(require_event_editor)],
-    _user_data: Annotated[models.UserData, Depends(CurrentUser)],
+    _user_data: Annotated[models.UserData, Depends(CurrentUser())],
     cache: Annotated[Valkey, Depends(with_vk)],
 ):
 
-    cache_key = f"{event.slug}:{artistId}"
+    cache_key = artist_cache_key(event.slug, artistId)
 
     cached_data = await cache.hget(cache_key, "locked")
 
@@ -313,43 +419,53 @@ async def get_artist_locked_status_for_event(
 
 
 @api_router.patch(
-    "/{eventId}/artist/{artistId}", dependencies=[Depends(expire_stale_seats)]
+    "/{eventId}/artist/{artistId}",
+    dependencies=[Depends(write_limiter), Depends(expire_stale_seats)],
 )
 async def update_artist_details(
     artistId: str,
     details: ArtistCustomizableDetails,
     response: Response,
     event: Annotated[models.Event, Depends(require_event_editor)],
-    user_data: Annotated[models.UserData, Depends(CurrentUser)],
+    user_data: Annotated[models.UserData, Depends(CurrentUser())],
     db: Annotated[AsyncSession, Depends(with_db)],
+    cache: Annotated[Valkey, Depends(with_vk)],
 ):
     """
     Event editors can update artist profile details.
     """
-    log.info(f"{event.slug}/artist/{artistId} update called by {user_data.username}")
-
-    artist_stmt = select(models.Artist).where(
-        (models.Artist.slug == artistId) & (models.Artist.event_id == event.id)
+    log.info("%s/artist/%s update called by %s", event.slug, artistId, user_data.username)
+
+    # one UPDATE round trip instead of SELECT, mutate, then UPDATE at flush
+    update_stmt = (
+        update(models.Artist)
+        .where(
+            models.Artist.slug == artistId,
+            models.Artist.event_id == event.id,
+        )
+        .values(
+            name=details.name,
+            details=details.details,
+            profileUrl=str(details.profileUrl),
+            coms_open=details.commissionsOpen,
+            coms_remaining=details.commissionsRemaining,
+        )
+        .returning(models.Artist.id)
+        .execution_options(synchronize_session=False)
     )
-    artist = await db.scalar(artist_stmt)
+    updated_id = (await db.execute(update_stmt)).scalar_one_or_none()
 
-    if not artist:
-        log.debug(f"Artist {artistId} not found")
+    if updated_id is None:
+        log.debug("Artist %s not found", artistId)
         response.status_code = status.HTTP_404_NOT_FOUND
-        return StandardError(
-            code=status.HTTP_404_NOT_FOUND,
-            type=StandardErrorTypes.ARTIST_NOT_FOUND,
-        )
-
-    artist.name = details.name
-    artist.details = details.details
-    artist.profileUrl = str(details.profileUrl)
-    artist.coms_open = details.commissionsOpen
-    artist.coms_remaining = details.commissionsRemaining
+        return _ARTIST_NOT_FOUND_404
 
-    await db.commit()
+    # evict the public details payload so readers don't see the old profile
+    await asyncio.gather(
+        db.commit(), cache.delete(artist_details_cache_key(artistId))
+    )
 
-    log.info(f"Artist {artistId} updated by {user_data.username}")
+    log.info("Artist %s updated by %s", artistId, user_data.username)
 
     return True
 
@@ -360,14 +476,15 @@ class AssignSeat(BaseModel):
 
 
 @api_router.put(
-    "/{eventId}/artist/{artistId}/seat", dependencies=[Depends(expire_stale_seats)]
+    "/{eventId}/artist/{artistId}/seat",
+    dependencies=[Depends(write_limiter), Depends(expire_stale_seats)],
 )
 async def assign_artist_to_seat(
     artistId: str,
     seat_request: AssignSeat,
     response: Response,
     event: Annotated[models.Event, Depends(require_event_editor)],
-    user_data: Annotated[models.UserData, Depends(CurrentUser)],
+    user_data: Annotated[models.UserData, Depends(CurrentUser())],
     db: Annotated[AsyncSession, Depends(with_db)],
     cache: Annotated[Valkey, Depends(with_vk)],
 ):
@@ -375,22 +492,16 @@ async def assign_artist_to_seat(
     Assign an existing artist to a seat.
     Ends any current assignment and creates a new one.
     """
-    log.info(f"{event.slug}/artist/{artistId}/seat PUT called by {user_data.username}")
+    log.info("%s/artist/%s/seat PUT called by %s", event.slug, artistId, user_data.username)
 
-    artist_stmt = (
-        select(models.Artist)
-        .where((models.Artist.slug == artistId) & (models.Artist.event_id == event.id))
-        .options(selectinload(models.Artist.assignments))
+    artist = await db.scalar(
+        _ARTIST_WITH_ASSIGNMENTS_STMT, {"slug": artistId, "event_id": event.id}
     )
-    artist = await db.scalar(artist_stmt)
 
     if not artist:
-        log.debug(f"Artist {artistId} not found")
+        log.debug("Artist %s not found", artistId)
         response.status_code = status.HTTP_404_NOT_FOUND
-        return StandardError(
-            code=status.HTTP_404_NOT_FOUND,
-            type=StandardErrorTypes.ARTIST_NOT_FOUND,
-        )
+        return _ARTIST_NOT_FOUND_404
 
     if artist.current_seat is not None:
         log.debug("Artist currently assigned to seat, ignoring request to set new seat")
@@ -405,7 +516,10 @@ async def assign_artist_to_seat(
     if dwellPeriod is not None and 0 <= dwellPeriod < event.dwellPeriod:
         if not seat_request.force:
             log.warning(
-                f"Artist {artistId} still in dwell period: {dwellPeriod}s < {event.dwellPeriod}s"
+                "Artist %s still in dwell period: %ss < %ss",
+                artistId,
+                dwellPeriod,
+                event.dwellPeriod,
             )
             response.status_code = status.HTTP_400_BAD_REQUEST
             return StandardError(
@@ -417,32 +531,34 @@ async def assign_artist_to_seat(
                     "remaining": str(event.dwellPeriod - dwellPeriod),
                 },
             )
-        log.info(f"Force override: allowing {artistId} despite dwell period")
+        log.info("Force override: allowing %s despite dwell period", artistId)
 
-    seat = next((s for s in event.seats if s.seat_number == seat_request.seat), None)
+    seat = await db.scalar(
+        _SEAT_BY_NUMBER_STMT,
+        {"event_id": event.id, "seat_number": seat_request.seat},
+    )
 
     if not seat:
-        log.debug(f"Seat {seat_request.seat} not found")
+        log.debug("Seat %s not found", seat_request.seat)
         response.status_code = status.HTTP_400_BAD_REQUEST
-        return StandardError(
-            code=status.HTTP_400_BAD_REQUEST,
-            type=StandardErrorTypes.INVALID_SEAT,
-        )
+        return _INVALID_SEAT_400
 
     if seat.current_artist and seat.current_artist.id != artist.id:
-        log.debug(f"Seat {seat_request.seat} already occupied")
+        log.debug("Seat %s already occupied", seat_request.seat)
         response.status_code = status.HTTP_409_CONFLICT
-        return StandardError(
-            code=status.HTTP_409_CONFLICT,
-            type=StandardErrorTypes.SEAT_TAKEN,
+        return _SEAT_TAKEN_409
+
+    # End any active assignment with one UPDATE instead of scanning the
+    # loaded collection; sqlite (dev/test) can't run DML inside a CTE, so the
+    # insert stays a separate statement in the same transaction
+    await db.execute(
+        update(models.SeatAssignment)
+        .where(
+            models.SeatAssignment.artist_id == artist.id,
+            models.SeatAssignment.ended_at.is_(None),
         )
-
-    # End current assignment if exists
-    active_assignment = next(
-        (a for a in artist.assignments if a.ended_at is None), None
+        .values(ended_at=models.utcnow())
     )
-    if active_assignment:
-        active_assignment.ended_at = models.utcnow()
 
     # Create new assignment
     new_assignment = models.SeatAssignment(
@@ -453,26 +569,35 @@ async def assign_artist_to_seat(
     db.add(new_assignment)
     await db.commit()
 
-    await cache.hset(
-        f"{event.slug}:{artistId}",
-        mapping={"status": ArtistSeatStatus.active, "seat": seat_request.seat},
-    )
+    # update the token hash and drop the cached details payload, whose
+    # active/timeRemaining fields just changed, in one round trip
+    async with cache.pipeline(transaction=False) as pipe:
+        pipe.hset(
+            artist_cache_key(event.slug, artistId),
+            mapping={"status": ArtistSeatStatus.active, "seat": seat_request.seat},
+        )
+        pipe.delete(artist_details_cache_key(artistId))
+        await pipe.execute()
 
     log.info(
-        f"Artist {artistId} assigned to seat {seat_request.seat} by {user_data.username}"
+        "Artist %s assigned to seat %s by %s",
+        artistId,
+        seat_request.seat,
+        user_data.username,
     )
 
     return True
 
 
 @api_router.delete(
-    "/{eventId}/artist/{artistId}/seat", dependencies=[Depends(expire_stale_seats)]
+    "/{eventId}/artist/{artistId}/seat",
+    dependencies=[Depends(write_limiter), Depends(expire_stale_seats)],
 )
 async def remove_artist_from_seat(
     artistId: str,
     response: Response,
     event: Annotated[models.Event, Depends(require_event_editor)],
-    user_data: Annotated[models.UserData, Depends(CurrentUser)],
+    user_data: Annotated[models.UserData, Depends(CurrentUser())],
     db: Annotated[AsyncSession, Depends(with_db)],
     cache: Annotated[Valkey, Depends(with_vk)],
 ):
@@ -481,21 +606,20 @@ async def remove_artist_from_seat(
     Ends the current seat assignment.
     """
     log.info(
-        f"{event.slug}/artist/{artistId}/seat delete called by {user_data.username}"
+        "%s/artist/%s/seat delete called by %s",
+        event.slug,
+        artistId,
+        user_data.username,
     )
 
-    artist_stmt = select(models.Artist).where(
-        (models.Artist.slug == artistId) & (models.Artist.event_id == event.id)
+    artist = await db.scalar(
+        _ARTIST_ID_ONLY_STMT, {"slug": artistId, "event_id": event.id}
     )
-    artist = await db.scalar(artist_stmt)
 
     if not artist:
-        log.debug(f"Artist {artistId} not found")
+        log.debug("Artist %s not found", artistId)
         response.status_code = status.HTTP_404_NOT_FOUND
-        return StandardError(
-            code=status.HTTP_404_NOT_FOUND,
-            type=StandardErrorTypes.ARTIST_NOT_FOUND,
-        )
+        return _ARTIST_NOT_FOUND_404
 
     assignment_stmt = select(models.SeatAssignment).where(
         and_(
@@ -506,31 +630,32 @@ async def remove_artist_from_seat(
     active_assignment = await db.scalar(assignment_stmt)
 
     if not active_assignment:
-        log.debug(f"Artist {artistId} has no active seat")
+        log.debug("Artist %s has no active seat", artistId)
         response.status_code = status.HTTP_404_NOT_FOUND
-        return StandardError(
-            code=status.HTTP_404_NOT_FOUND,
-            type=StandardErrorTypes.NO_ACTIVE_SEAT,
-        )
+        return _NO_ACTIVE_SEAT_404
 
     active_assignment.ended_at = models.utcnow()
     await db.commit()
 
-    await cache.hset(f"{event.slug}:{artistId}", "status", ArtistSeatStatus.inactive)
+    async with cache.pipeline(transaction=False) as pipe:
+        pipe.hset(artist_cache_key(event.slug, artistId), "status", ArtistSeatStatus.inactive)
+        pipe.delete(artist_details_cache_key(artistId))
+        await pipe.execute()
 
-    log.info(f"Artist {artistId} removed from seat by {user_data.username}")
+    log.info("Artist %s removed from seat by %s", artistId, user_data.username)
 
     return True
 
 
 @api_router.delete(
-    "/{eventId}/artist/{artistId}", dependencies=[Depends(expire_stale_seats)]
+    "/{eventId}/artist/{artistId}",
+    dependencies=[Depends(write_limiter), Depends(expire_stale_seats)],
 )
 async def remove_artist_from_event(
     artistId: str,
     response: Response,
     event: Annotated[models.Event, Depends(require_event_editor)],
-    user_data: Annotated[models.UserData, Depends(CurrentUser)],
+    user_data: Annotated[models.UserData, Depends(CurrentUser())],
     db: Annotated[AsyncSession, Depends(with_db)],
     cache: Annotated[Valkey, Depends(with_vk)],
 ):
@@ -538,29 +663,33 @@ async def remove_artist_from_event(
     Remove artist completely from the event.
     Deletes the artist record and all associated seat assignments.
     """
-    log.info(f"{event.slug}/artist/{artistId} delete called by {user_data.username}")
-
-    artist_stmt = (
-        select(models.Artist)
-        .where((models.Artist.slug == artistId) & (models.Artist.event_id == event.id))
-        .options(selectinload(models.Artist.assignments))
+    log.info("%s/artist/%s delete called by %s", event.slug, artistId, user_data.username)
+
+    # Core DELETE; the artist_id FK is ON DELETE CASCADE so the DB removes
+    # the assignments without the ORM loading them first
+    result = await db.execute(
+        delete(models.Artist)
+        .where(
+            models.Artist.slug == artistId,
+            models.Artist.event_id == event.id,
+        )
+        .returning(models.Artist.id)
     )
 
-    artist = await db.scalar(artist_stmt)
-
-    if not artist:
-        log.debug(f"Artist {artistId} not found")
+    if result.scalar() is None:
+        log.debug("Artist %s not found", artistId)
         response.status_code = status.HTTP_404_NOT_FOUND
-        return StandardError(
-            code=status.HTTP_404_NOT_FOUND,
-            type=StandardErrorTypes.ARTIST_NOT_FOUND,
-        )
-
-    await db.delete(artist)
-    await db.commit()
-
-    await cache.delete(f"{event.slug}:{artistId}")
+        return _ARTIST_NOT_FOUND_404
+
+    # commit and cache eviction touch different backends; overlap them
+    await asyncio.gather(
+        db.commit(),
+        cache.delete(
+            artist_cache_key(event.slug, artistId),
+            artist_details_cache_key(artistId),
+        ),
+    )
 
-    log.info(f"Artist {artistId} removed from event by {user_data.username}")
+    log.info("Artist %s removed from event by %s", artistId, user_data.username)
 
     return True
@@ -1,9 +1,12 @@
-from datetime import datetime
+import asyncio
+import hashlib
+from datetime import datetime, timezone
 from typing import Annotated
-from zoneinfo import ZoneInfo
-from fastapi import APIRouter, Depends, HTTPException, status, Response, Security
-from pydantic import BaseModel
-from sqlalchemy import select, exists, delete
+from fastapi import APIRouter, Depends, HTTPException, Request, status, Response, Security
+from fastapi.responses import ORJSONResponse
+from pydantic import BaseModel, TypeAdapter
+from sqlalchemy import bindparam, case, func, insert, select, exists, delete
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 from valkey.asyncio import Valkey
@@ -15,77 +18,195 @@ from cctracker.models.artists import ArtistSummary
 from cctracker.models.events import EventDetails, EventList, NewEvent, OpenTimes
 from cctracker.models.errors import StandardError, StandardErrorTypes
 from cctracker.server.auth import CurrentPrincipal, Principal
-from cctracker.server.helpers import CurrentUser, with_event, require_event_editor
-from cctracker.server.seat_expiration_helper import expire_stale_seats
+from cctracker.server.helpers import (
+    CurrentUser,
+    WithEvent,
+    with_event_row,
+    require_event_editor,
+)
+from cctracker.server.seat_expiration_helper import (
+    expire_stale_seats,
+    expire_stale_seats_bulk,
+)
 
 
 _log = get_logger(__name__)
 
-api_router = APIRouter(prefix="/event", tags=["event operations"])
+# identical payload for every caller; a couple of seconds of staleness is fine
+_EVENT_LIST_CACHE_KEY = "events:list:v1"
+# short TTL: seat claims and expirations change seatsAvailable without
+# passing through the write endpoints that delete the key
+_EVENT_LIST_CACHE_TTL = 5  # seconds; event writes also delete the key explicitly
+
+
+def _all_events_stmt():
+    """List-view statement, built once at import.
+
+    start/end, the upcoming/current/past split, and the open flag all come
+    from SQL, so the classification never walks open_times per event; the
+    "now"/"today" bindparams keep the compiled form cacheable.
+    """
+    now = bindparam("now")
+    today = bindparam("today")
+
+    times = (
+        select(
+            models.OpenTime.event_id,
+            func.min(models.OpenTime.open_time).label("start"),
+            func.max(models.OpenTime.close_time).label("end"),
+            func.max(
+                case(
+                    (
+                        (models.OpenTime.open_time <= now)
+                        & (models.OpenTime.close_time > now),
+                        1,
+                    ),
+                    else_=0,
+                )
+            ).label("open_now"),
+        )
+        .group_by(models.OpenTime.event_id)
+        .subquery()
+    )
+    bucket = case(
+        (times.c.start.is_(None), "upcoming"),
+        (func.date(times.c.start) > today, "upcoming"),
+        (func.date(times.c.end) < today, "past"),
+        else_="current",
+    ).label("bucket")
+
+    # one aggregated row per event instead of every seat/assignment row
+    seat_counts = (
+        select(
+            models.Seat.event_id,
+            func.count(models.Seat.id).label("seats"),
+        )
+        .group_by(models.Seat.event_id)
+        .subquery()
+    )
+    active_counts = (
+        select(
+            models.SeatAssignment.event_id,
+            func.count(func.distinct(models.SeatAssignment.seat_id)).label("taken"),
+        )
+        .where(models.SeatAssignment.ended_at.is_(None))
+        .group_by(models.SeatAssignment.event_id)
+        .subquery()
+    )
+
+    return (
+        select(
+            models.Event,
+            times.c.start,
+            times.c.end,
+            times.c.open_now,
+            bucket,
+            func.coalesce(seat_counts.c.seats, 0).label("seats"),
+            func.coalesce(active_counts.c.taken, 0).label("taken"),
+        )
+        .outerjoin(times, times.c.event_id == models.Event.id)
+        .outerjoin(seat_counts, seat_counts.c.event_id == models.Event.id)
+        .outerjoin(active_counts, active_counts.c.event_id == models.Event.id)
+    )
+
+
+_ALL_EVENTS_STMT = _all_events_stmt()
+
+_SLUG_EXISTS_STMT = select(exists().where(models.Event.slug == bindparam("slug")))
+
+# the editor endpoints only ever need the target user's id
+_USER_ID_BY_USERNAME_STMT = select(models.UserData.id).where(
+    models.UserData.username == bindparam("username")
+)
+
+# validates a whole open-times list in one pydantic-core pass
+_OPEN_TIMES_ADAPTER = TypeAdapter(list[OpenTimes])
+
+# narrowed event load: the detail view reads the time/seat derived
+# properties (artists kept so current_artist resolves from the identity
+# map); the artist and editor listings ride on the shared with_event_row
+with_event_details = WithEvent("open_times", "seats", "artists")
+
+
+def _etag_for(body: str | bytes) -> str:
+    """Weak ETag over the serialized payload, cheap enough to do per response."""
+    if isinstance(body, str):
+        body = body.encode()
+    return f'W/"{hashlib.blake2b(body, digest_size=8).hexdigest()}"'
+
+
+def _json_or_304(request: Request, body: str | bytes) -> Response:
+    """Serve a JSON body with an ETag, short-circuiting to 304 on a match."""
+    etag = _etag_for(body)
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED)
+    return Response(
+        content=body, media_type="application/json", headers={"ETag": etag}
+    )
+
+api_router = APIRouter(
+    prefix="/event",
+    tags=["event operations"],
+    default_response_class=ORJSONResponse,
+)
 
 
 @api_router.get("/list")
-async def get_all_events(db: Annotated[AsyncSession, Depends(with_db)],
+async def get_all_events(request: Request,
+                         db: Annotated[AsyncSession, Depends(with_db)],
                          vk: Annotated[Valkey, Depends(with_vk)]) -> EventList:
     """Get all events"""
 
     _log.info("Fetching all events")
 
+    cached = await vk.get(_EVENT_LIST_CACHE_KEY)
+    if cached is not None:
+        _log.debug("Serving event list from cache")
+        return _json_or_304(request, cached)
+
     event_list = EventList()
 
-    stmt = select(models.Event).options(
-        selectinload(models.Event.open_times),
-        selectinload(models.Event.seats).selectinload(models.Seat.assignments),
-        selectinload(models.Event.artists),
-        selectinload(models.Event.assignments),
-    )
+    # sweep stale assignments first so the aggregates below count them as
+    # freed; one pass for every event instead of a lock/refresh per row
+    event_ids = (await db.scalars(select(models.Event.id))).all()
+    await expire_stale_seats_bulk(list(event_ids), db, vk)
+
     _log.debug("Executing database query for all events")
-    results = await db.scalars(stmt)
-
-    today = datetime.now(ZoneInfo("UTC"))
-    for result in results:
-        await expire_stale_seats(result, db, vk)
-        event = EventDetails(
-            name=result.name,
-            slug=result.slug,
-            hostedBy=result.hostedBy,
-            hostedByUrl=result.hostedByUrl,
-            startDate=result.event_start,
-            endDate=result.event_end,
-            seats=result.seat_count,
-            seatsAvailable=result.seats_available,
-            open=result.event_open,
-            duration=result.seatDuration,
+    rows = (
+        await db.execute(
+            _ALL_EVENTS_STMT,
+            {
+                "now": datetime.now(timezone.utc),
+                "today": datetime.now(timezone.utc).date(),
+            },
+        )
+    ).all()
+
+    for result, start, end, open_now, category, seats, taken in rows:
+        event = EventDetails.from_orm_event(
+            result,
+            startDate=start,
+            endDate=end,
+            seats=seats,
+            seatsAvailable=seats - taken,
+            open=bool(open_now) and not result.forceClose,
         )
 
-        _log.debug(f"Event: {event}")
+        _log.debug("Event: %s", event)
 
-        if event.startDate is None or event.endDate is None:
+        if start is None or end is None:
             _log.warning(
-                f"Start and end date not defined for {event.name} - {event.slug}"
+                "Start and end date not defined for %s - %s", event.name, event.slug
             )
-            event_list.upcoming.append(event)
-            continue
-
-        assert event.startDate is not None
-        assert event.endDate is not None
 
-        if event.startDate.date() > today.date():
-            _log.debug("Start date > today")
-            event_list.upcoming.append(event)
-
-        elif event.endDate.date() < today.date():
-            _log.debug("End date < today")
-            event_list.past.append(event)
-
-        else:
-            _log.debug("Current Event")
-            event_list.current.append(event)
-    _log.info(f"Retrieved {len(event_list.upcoming)} upcoming, ")
+        getattr(event_list, category).append(event)
+    _log.info("Retrieved %s upcoming, ", len(event_list.upcoming))
     _log.info(
-        f"{len(event_list.current)} current, and {len(event_list.past)} past events"
+        "%s current, and %s past events", len(event_list.current), len(event_list.past)
     )
-    return event_list
+    body = event_list.model_dump_json()
+    await vk.set(_EVENT_LIST_CACHE_KEY, body, ex=_EVENT_LIST_CACHE_TTL)
+    return _json_or_304(request, body)
 
 
 @api_router.post("/create")
@@ -93,29 +214,15 @@ async def create_event(
     newEventDetails: NewEvent,
     response: Response,
     user: Annotated[
-        models.UserData, Security(CurrentUser, scopes=["event:create"])
+        models.UserData, Security(CurrentUser(), scopes=["event:create"])
     ],
     db: Annotated[AsyncSession, Depends(with_db)],
+    vk: Annotated[Valkey, Depends(with_vk)],
 ) -> StandardError | EventDetails:
     _log.info(
-        f"User attempting to create event: '{newEventDetails.name}' with slug '{newEventDetails.slug}'"
+        "User attempting to create event: '%s' with slug '%s'", newEventDetails.name, newEventDetails.slug
     )
 
-    exists_stmt = select(exists().where(models.Event.slug == newEventDetails.slug))
-    slug_exists = await db.scalar(exists_stmt)
-
-    if bool(slug_exists):
-        _log.warning(
-            f"Event creation failed: slug '{newEventDetails.slug}' already exists"
-        )
-        response.status_code = status.HTTP_409_CONFLICT
-        return StandardError(
-            code=status.HTTP_409_CONFLICT,
-            type=StandardErrorTypes.SLUG_EXISTS,
-        )
-
-    _log.debug("Slug does not exist, continuing")
-
     new_event = models.Event(
         slug=newEventDetails.slug,
         name=newEventDetails.name,
@@ -129,11 +236,12 @@ async def create_event(
 
     new_event.editors.append(user)
 
-    _log.debug(f"New Event: {new_event}")
+    _log.debug("New Event: %s", new_event)
 
     if len(newEventDetails.openTimes) == 0:
         _log.warning(
-            f"Event creation failed: no open times specified for '{newEventDetails.name}'"
+            "Event creation failed: no open times specified for '%s'",
+            newEventDetails.name,
         )
         response.status_code = status.HTTP_400_BAD_REQUEST
         return StandardError(
@@ -147,114 +255,140 @@ async def create_event(
             )
         )
 
-    new_event.seats = [
-        models.Seat(seat_number=i) for i in range(1, newEventDetails.seats + 1)
-    ]
     _log.debug(
-        f"Creating event with {newEventDetails.seats} seats and {len(newEventDetails.openTimes)} time slots"
+        "Creating event with %s seats and %s time slots", newEventDetails.seats, len(newEventDetails.openTimes)
     )
 
     db.add(new_event)
-    await db.commit()
+    # the unique constraint on Event.slug rejects duplicates at flush time,
+    # replacing the old SELECT-then-INSERT pre-check and its race
+    try:
+        # flush to get the event id, then create all seats in one multi-row
+        # INSERT instead of letting the ORM emit one statement per seat
+        await db.flush()
+    except IntegrityError:
+        await db.rollback()
+        _log.warning(
+            "Event creation failed: slug '%s' already exists", newEventDetails.slug
+        )
+        response.status_code = status.HTTP_409_CONFLICT
+        return StandardError(
+            code=status.HTTP_409_CONFLICT,
+            type=StandardErrorTypes.SLUG_EXISTS,
+        )
+    await db.execute(
+        insert(models.Seat),
+        [
+            {"event_id": new_event.id, "seat_number": i}
+            for i in range(1, newEventDetails.seats + 1)
+        ],
+    )
+    # the commit and the cache eviction touch different backends; overlap them
+    await asyncio.gather(db.commit(), vk.delete(_EVENT_LIST_CACHE_KEY))
+
     _log.info(
-        f"Successfully created event '{new_event.name}' with slug '{new_event.slug}'"
+        "Successfully created event '%s' with slug '%s'", new_event.name, new_event.slug
     )
 
     response.status_code = status.HTTP_201_CREATED
-    return EventDetails(
-        name=new_event.name,
-        slug=new_event.slug,
-        hostedBy=new_event.hostedBy,
-        hostedByUrl=new_event.hostedByUrl,
+    return EventDetails.from_orm_event(
+        new_event,
         startDate=new_event.event_start,
         endDate=new_event.event_end,
-        seats=new_event.seat_count,
-        seatsAvailable=new_event.seat_count,
+        seats=newEventDetails.seats,
+        seatsAvailable=newEventDetails.seats,
         open=new_event.event_open,
-        duration=new_event.seatDuration,
     )
 
 
 @api_router.get("/{eventId}", dependencies=[Depends(expire_stale_seats)])
 async def get_event(
     eventId: str,
-    event: Annotated[models.Event, Depends(with_event)],
+    request: Request,
+    event: Annotated[models.Event, Depends(with_event_details)],
     db: Annotated[AsyncSession, Depends(with_db)],
 ) -> EventDetails:
 
-    _log.debug(f"Fetching details for event '{eventId}'")
-
-    openTimes: list[OpenTimes] = []
+    _log.debug("Fetching details for event '%s'", eventId)
 
-    for time in event.open_times:
-        openTimes.append(
-            OpenTimes(open_time=time.open_time, close_time=time.close_time)
-        )
+    openTimes = _OPEN_TIMES_ADAPTER.validate_python(
+        [
+            {"open_time": t.open_time, "close_time": t.close_time}
+            for t in event.open_times
+        ]
+    )
 
-    event_details = EventDetails(
-        name=event.name,
-        slug=event.slug,
-        hostedBy=event.hostedBy,
-        hostedByUrl=event.hostedByUrl,
+    event_details = EventDetails.from_orm_event(
+        event,
         startDate=event.event_start,
         endDate=event.event_end,
         seats=event.seat_count,
         seatsAvailable=event.seats_available,
         open=event.event_open,
         openTimes=openTimes,
-        duration=event.seatDuration,
     )
 
     _log.debug(
-        f"Event '{eventId}': {event.seats_available}/{event.seat_count} seats available, "
+        "Event '%s': %s/%s seats available, ", eventId, event.seats_available, event.seat_count
     )
-    _log.debug(f"open={event.event_open}")
+    _log.debug("open=%s", event.event_open)
 
-    return event_details
+    return _json_or_304(request, event_details.model_dump_json())
 
 
 @api_router.get("/{eventId}/artists", dependencies=[Depends(expire_stale_seats)])
 async def get_event_artists(
     eventId: str,
     all: bool,
-    event: Annotated[models.Event, Depends(with_event)],
+    event: Annotated[models.Event, Depends(with_event_row)],
     db: Annotated[AsyncSession, Depends(with_db)],
 ) -> list[ArtistSummary]:
     """
     Returns a list of all artists associated with the event.
     """
-    _log.debug(f"Fetching artists for event '{eventId}' (include_unseated={all})")
+    _log.debug("Fetching artists for event '%s' (include_unseated=%s)", eventId, all)
+
+    # join the current seat in SQL; unseated artists are filtered server-side
+    # unless the caller asked for them
+    stmt = (
+        select(
+            models.Artist.name,
+            models.Artist.slug,
+            models.Artist.imageUrl,
+            models.Seat.seat_number,
+        )
+        .select_from(models.Artist)
+        .outerjoin(
+            models.SeatAssignment,
+            (models.SeatAssignment.artist_id == models.Artist.id)
+            & (models.SeatAssignment.ended_at.is_(None)),
+        )
+        .outerjoin(models.Seat, models.Seat.id == models.SeatAssignment.seat_id)
+        .where(models.Artist.event_id == event.id)
+    )
+    if not all:
+        stmt = stmt.where(models.Seat.seat_number.is_not(None))
 
     artist_list: list[ArtistSummary] = []
     unseated_artists: list[ArtistSummary] = []
-    for artist in event.artists:
-        seat = artist.current_seat
-        if seat is None:
-            if all:
-                unseated_artists.append(
-                    ArtistSummary(
-                        name=artist.name,
-                        slug=artist.slug,
-                        eventId=eventId,
-                        imageUrl=artist.imageUrl,
-                        seat=0,
-                    )
-                )
-            continue
-
-        artist_list.append(
-            ArtistSummary(
-                name=artist.name,
-                slug=artist.slug,
-                eventId=eventId,
-                imageUrl=artist.imageUrl,
-                seat=seat.seat_number,
-            )
+    for name, slug, image_url, seat_number in await db.execute(stmt):
+        summary = ArtistSummary(
+            name=name,
+            slug=slug,
+            eventId=eventId,
+            imageUrl=image_url,
+            seat=seat_number or 0,
         )
+        if seat_number is None:
+            unseated_artists.append(summary)
+        else:
+            artist_list.append(summary)
 
     _log.info(
-        f"Event '{eventId}': returning {len(artist_list)} seated artists"
-        + (f" and {len(unseated_artists)} unseated artists" if unseated_artists else "")
+        "Event '%s': returning %s seated artists and %s unseated artists",
+        eventId,
+        len(artist_list),
+        len(unseated_artists),
     )
     artist_list += unseated_artists
 
@@ -269,32 +403,32 @@ async def update_event(
     response: Response,
     event: Annotated[models.Event, Depends(require_event_editor)],
     user: Annotated[
-        models.UserData | None, Depends(CurrentUser)
+        models.UserData | None, Depends(CurrentUser())
     ],
     db: Annotated[AsyncSession, Depends(with_db)],
+    vk: Annotated[Valkey, Depends(with_vk)],
 ) -> EventDetails | StandardError:
     """
     Update an existing event, changing only the fields provided in the NewEvent structure.
     Identified by slug in the path (eventId).
     """
 
-    _log.info(f"User attempting to update event '{eventId}'")
+    _log.info("User attempting to update event '%s'", eventId)
 
     if event.event_open:
-        _log.warning(f"Update denied: event '{eventId}' is currently running")
+        _log.warning("Update denied: event '%s' is currently running", eventId)
         response.status_code = status.HTTP_403_FORBIDDEN
         return StandardError(
             code=status.HTTP_403_FORBIDDEN, type=StandardErrorTypes.EVENT_STARTED
         )
 
     elif updatedEvent.slug != event.slug:
-        _log.debug(f"Event slug changing from '{event.slug}' to '{updatedEvent.slug}'")
-        exists_stmt = select(exists().where(models.Event.slug == updatedEvent.slug))
-        slug_taken = await db.scalar(exists_stmt)
+        _log.debug("Event slug changing from '%s' to '%s'", event.slug, updatedEvent.slug)
+        slug_taken = await db.scalar(_SLUG_EXISTS_STMT, {"slug": updatedEvent.slug})
 
         if slug_taken:
             _log.warning(
-                f"Update failed: new slug '{updatedEvent.slug}' already exists"
+                "Update failed: new slug '%s' already exists", updatedEvent.slug
             )
             response.status_code = status.HTTP_409_CONFLICT
             return StandardError(
@@ -321,58 +455,85 @@ async def update_event(
 
     if desired_seat_count != current_seat_count:
         _log.info(
-            f"Updating seat count for '{eventId}': {current_seat_count} -> {desired_seat_count}"
+            "Updating seat count for '%s': %s -> %s",
+            eventId,
+            current_seat_count,
+            desired_seat_count,
         )
-        # Simple approach: drop all and recreate
-        # (If you need to preserve assignments, you can swap this for smarter logic)
-        event.seats.clear()
-        event.seats = [
-            models.Seat(seat_number=i) for i in range(1, desired_seat_count + 1)
-        ]
+        # Only touch the delta: existing seats (and their assignment history)
+        # survive a resize, so a +1/-1 tweak is one statement, not a rebuild
+        if desired_seat_count > current_seat_count:
+            await db.execute(
+                insert(models.Seat),
+                [
+                    {"event_id": event.id, "seat_number": i}
+                    for i in range(current_seat_count + 1, desired_seat_count + 1)
+                ],
+            )
+        else:
+            await db.execute(
+                delete(models.Seat).where(
+                    models.Seat.event_id == event.id,
+                    models.Seat.seat_number > desired_seat_count,
+                )
+            )
 
-    await db.commit()
-    await db.refresh(event)
+    await asyncio.gather(db.commit(), vk.delete(_EVENT_LIST_CACHE_KEY))
 
-    updated = EventDetails(
-        name=event.name,
-        slug=event.slug,
-        hostedBy=event.hostedBy,
-        hostedByUrl=event.hostedByUrl,
+    # every returned field was just set in this session (expire_on_commit is
+    # off), so a refresh SELECT would only re-read our own writes
+    updated = EventDetails.from_orm_event(
+        event,
         startDate=event.event_start,
         endDate=event.event_end,
-        seats=event.seat_count,
-        seatsAvailable=event.seat_count,
+        seats=desired_seat_count,
+        seatsAvailable=desired_seat_count,
         open=event.event_open,
-        duration=event.seatDuration,
-        openTimes=[
-            OpenTimes(open_time=t.open_time, close_time=t.close_time)
-            for t in event.open_times
-        ],
+        openTimes=_OPEN_TIMES_ADAPTER.validate_python(
+            [
+                {"open_time": t.open_time, "close_time": t.close_time}
+                for t in event.open_times
+            ]
+        ),
     )
 
-    _log.info(f"Successfully updated event '{eventId}' (new slug: '{updated.slug}')")
+    _log.info("Successfully updated event '%s' (new slug: '%s')", eventId, updated.slug)
     return updated
 
 
 @api_router.delete("/{eventId}")
 async def delete_event(
     eventId: str,
-    event: Annotated[models.Event, Depends(with_event)],
     user: Annotated[
-        models.UserData, Security(CurrentUser, scopes=["admin", "event:create"])
+        models.UserData, Security(CurrentUser(), scopes=["admin", "event:create"])
     ],
     principal: Annotated[Principal, Depends(CurrentPrincipal)],
     db: Annotated[AsyncSession, Depends(with_db)],
+    vk: Annotated[Valkey, Depends(with_vk)],
 ):
     """Delete an event, Admin only"""
-    _log.info(f"User: {user.username} is attempting to delete event '{eventId}'")
-    _log.debug(f"scopes for user: {principal.scopes}")
-    _log.debug(f"Event owner: {event.owner.username}")
-
-    if "admin" in principal.scopes or user.username == event.owner.username:
-        await db.delete(event)
-        await db.commit()
-        _log.info(f"Successfully deleted event '{eventId}'")
+    _log.info("User: %s is attempting to delete event '%s'", user.username, eventId)
+    _log.debug("scopes for user: %s", principal.scopes)
+
+    # only the owner's name is needed for the permission check; skip the
+    # full with_event aggregate load
+    owner_username = await db.scalar(
+        select(models.UserData.username)
+        .join(models.Event, models.Event.owner_user_id == models.UserData.id)
+        .where(models.Event.slug == eventId)
+    )
+    if owner_username is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND, detail=f"{eventId} not found"
+        )
+    _log.debug("Event owner: %s", owner_username)
+
+    if "admin" in principal.scopes or user.username == owner_username:
+        # the child FKs all cascade in the DB, so one DELETE covers the
+        # seats, open times, artists and assignments
+        await db.execute(delete(models.Event).where(models.Event.slug == eventId))
+        await asyncio.gather(db.commit(), vk.delete(_EVENT_LIST_CACHE_KEY))
+        _log.info("Successfully deleted event '%s'", eventId)
         return
 
     raise HTTPException(
@@ -390,37 +551,50 @@ async def add_event_editor(
     eventId: str,
     editor: Editor,
     event: Annotated[models.Event, Depends(require_event_editor)],
-    user: Annotated[models.UserData, Depends(CurrentUser)],
+    user: Annotated[models.UserData, Depends(CurrentUser())],
     db: Annotated[AsyncSession, Depends(with_db)],
 ):
     """Add an editor to the event"""
     _log.info(
-        f"User {user.username} adding editor {editor.username} to event {eventId}"
+        "User %s adding editor %s to event %s", user.username, editor.username, eventId
     )
 
-    stmt = select(models.UserData).where(models.UserData.username == editor.username)
-    target_user = await db.scalar(stmt)
+    target_user_id = await db.scalar(
+        _USER_ID_BY_USERNAME_STMT, {"username": editor.username}
+    )
 
-    if not target_user:
+    if not target_user_id:
         _log.warning(
-            f"User {editor.username} not found when adding as editor to {eventId}"
+            "User %s not found when adding as editor to %s", editor.username, eventId
         )
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"User {editor.username} not found",
         )
 
-    if target_user in event.editors:
-        _log.warning(f"{editor.username} is already an editor of {eventId}")
+    already_editor = await db.scalar(
+        select(
+            exists().where(
+                models.EventEditor.event_id == event.id,
+                models.EventEditor.user_id == target_user_id,
+            )
+        )
+    )
+    if already_editor:
+        _log.warning("%s is already an editor of %s", editor.username, eventId)
         raise HTTPException(
             status_code=status.HTTP_409_CONFLICT,
             detail=f"{editor.username} is already an editor",
         )
 
-    event.editors.append(target_user)
+    # one-row insert into the association table; no need to materialize and
+    # mutate the editors collection
+    await db.execute(
+        insert(models.EventEditor).values(event_id=event.id, user_id=target_user_id)
+    )
     await db.commit()
 
-    _log.info(f"Added {editor.username} as editor to {eventId}")
+    _log.info("Added %s as editor to %s", editor.username, eventId)
 
 
 @api_router.delete(
@@ -430,52 +604,62 @@ async def remove_event_editor(
     eventId: str,
     editor: Editor,
     event: Annotated[models.Event, Depends(require_event_editor)],
-    user: Annotated[models.UserData, Depends(CurrentUser)],
+    user: Annotated[models.UserData, Depends(CurrentUser())],
     db: Annotated[AsyncSession, Depends(with_db)],
 ):
     """Remove an editor from the event"""
     username = editor.username
-    _log.info(f"User {user.username} removing editor {username} from event {eventId}")
+    _log.info("User %s removing editor %s from event %s", user.username, username, eventId)
 
-    if event.owner.username is not user.username:
+    if event.owner.username != user.username:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Only the event owner can delete an event",
         )
 
-    stmt = select(models.UserData).where(models.UserData.username == username)
-    target_user = await db.scalar(stmt)
+    target_user_id = await db.scalar(_USER_ID_BY_USERNAME_STMT, {"username": username})
 
-    if not target_user:
+    if not target_user_id:
         _log.warning(
-            f"User {username} not found when removing as editor from {eventId}"
+            "User %s not found when removing as editor from %s", username, eventId
         )
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND, detail=f"User {username} not found"
         )
 
-    if target_user not in event.editors:
-        _log.warning(f"{username} is not an editor of {eventId}")
+    result = await db.execute(
+        delete(models.EventEditor).where(
+            models.EventEditor.event_id == event.id,
+            models.EventEditor.user_id == target_user_id,
+        )
+    )
+    if result.rowcount == 0:
+        _log.warning("%s is not an editor of %s", username, eventId)
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND, detail=f"{username} is not an editor"
         )
 
-    event.editors.remove(target_user)
     await db.commit()
 
-    _log.info(f"Removed {username} as editor from {eventId}")
+    _log.info("Removed %s as editor from %s", username, eventId)
 
 
 @api_router.get("/{eventId}/editors", dependencies=[Depends(expire_stale_seats)])
 async def list_event_editors(
     eventId: str,
-    event: Annotated[models.Event, Depends(with_event)],
+    event: Annotated[models.Event, Depends(with_event_row)],
+    db: Annotated[AsyncSession, Depends(with_db)],
 ) -> list[Editor]:
     """List all editors for the event"""
-    _log.debug(f"Fetching editors for event {eventId}")
+    _log.debug("Fetching editors for event %s", eventId)
 
-    editors = await event.awaitable_attrs.editors
-    editor_list = [Editor(username=editor.username) for editor in editors]
+    # only usernames leave the DB; no UserData rows are materialized
+    usernames = await db.scalars(
+        select(models.UserData.username)
+        .join(models.EventEditor, models.EventEditor.user_id == models.UserData.id)
+        .where(models.EventEditor.event_id == event.id)
+    )
+    editor_list = [Editor(username=username) for username in usernames]
 
-    _log.info(f"Returning {len(editor_list)} editors for event {eventId}")
+    _log.info("Returning %s editors for event %s", len(editor_list), eventId)
     return editor_list
@@ -41,7 +41,7 @@ api_router = APIRouter(prefix="/user")
 async def request_permissions(
     response: Response,
     request_info: PermissionRequestInfo,
-    user_data: Annotated[models.UserData, Depends(CurrentUser)],
+    user_data: Annotated[models.UserData, Depends(CurrentUser())],
     db: Annotated[AsyncSession, Depends(with_db)],
 ):
     log.info(
@@ -107,7 +107,7 @@ async def request_permissions(
 
 @api_router.get("/requested_permissions")
 async def get_requested_permissions(
-    user_data: Annotated[models.UserData, Depends(CurrentUser)],
+    user_data: Annotated[models.UserData, Depends(CurrentUser())],
 ):
     log.debug(f"Fetching permission requests for {user_data.username}")
 
@@ -133,7 +133,7 @@ async def get_requested_permissions(
 @api_router.post("/artist_details")
 async def update_artist_details(
     details: ArtistCustomizableDetails_User,
-    user_data: Annotated[models.UserData, Depends(CurrentUser)],
+    user_data: Annotated[models.UserData, Depends(CurrentUser())],
     db: Annotated[AsyncSession, Depends(with_db)],
 ):
     """Update user's saved artist profile details"""
@@ -157,7 +157,7 @@ async def update_artist_details(
 
 @api_router.get("/artist_details")
 async def get_artist_details(
-    user_data: Annotated[models.UserData, Depends(CurrentUser)],
+    user_data: Annotated[models.UserData, Depends(CurrentUser())],
 ):
     """Get user's saved artist profile details"""
     log.debug(f"Fetching artist details for {user_data.username}")
@@ -180,7 +180,7 @@ async def get_artist_details(
 @api_router.post("/profile_picture")
 async def upload_profile_picture(
     file: UploadFile,
-    user_data: Annotated[models.UserData, Depends(CurrentUser)],
+    user_data: Annotated[models.UserData, Depends(CurrentUser())],
     db: Annotated[AsyncSession, Depends(with_db)],
     minio: Annotated[Minio, Depends(with_bucket)],
 ):
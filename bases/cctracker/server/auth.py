@@ -55,7 +55,7 @@ class DevTokenResponse(BaseModel):
 
 def create_dev_token(username: str, scopes: list[str]) -> str:
     """Create a development JWT token"""
-    _log.debug(f"Creating dev token for user '{username}' with scopes: {scopes}")
+    _log.debug("Creating dev token for user '%s' with scopes: %s", username, scopes)
     expire = datetime.now(timezone.utc) + timedelta(hours=24)
     payload = {
         "sub": username,
@@ -79,7 +79,7 @@ def decode_dev_jwt(token: str) -> dict[str, str]:
         payload = jwt.decode(
             token, "DEV_MODE_KEY", algorithms=["HS256"], audience="DEV_TOKEN"
         )
-        _log.debug(f"Successfully decoded dev token for user: {payload.get('sub')}")
+        _log.debug("Successfully decoded dev token for user: %s", payload.get('sub'))
         return payload
     except jwt.ExpiredSignatureError:
         _log.warning("Dev token decode failed: token expired")
@@ -87,18 +87,27 @@ def decode_dev_jwt(token: str) -> dict[str, str]:
             status_code=status.HTTP_401_UNAUTHORIZED, detail="Token Expired"
         )
     except jwt.InvalidTokenError as e:
-        _log.warning(f"Dev token decode failed: invalid token - {e}")
+        _log.warning("Dev token decode failed: invalid token - %s", e)
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid Token"
         )
 
 
+@lru_cache(maxsize=1024)
+def _dangerous_serializer(salt: str | None) -> URLSafeSerializer:
+    """Serializer per salt so key derivation runs once per event slug."""
+    if salt is None:
+        return dangerous_cookies
+    return URLSafeSerializer(config.signing_key, salt=salt)
+
+
 def sign(data: EventArtistToken, salt: str | None = None):
-    return dangerous_cookies.dumps(data, salt)
+    # itsdangerous only serializes JSON primitives, so dump the model first
+    return _dangerous_serializer(salt).dumps(data.model_dump(mode="json"))
 
 
 def verify(data: str, salt: str | None = None) -> EventArtistToken:
-    return EventArtistToken.model_validate(dangerous_cookies.loads(data, salt=salt))
+    return EventArtistToken.model_validate(_dangerous_serializer(salt).loads(data))
 
 
 @lru_cache(maxsize=1)
@@ -128,7 +137,7 @@ def decode_jwt(token: str) -> dict[str, str]:
             token, public_key, ["RS256"], audience=config.keycloak_client
         )
         _log.debug(
-            f"Successfully decoded Keycloak token for user: {payload.get('sub')}"
+            "Successfully decoded Keycloak token for user: %s", payload.get('sub')
         )
 
     except jwt.ExpiredSignatureError:
@@ -137,7 +146,7 @@ def decode_jwt(token: str) -> dict[str, str]:
             status_code=status.HTTP_401_UNAUTHORIZED, detail="Token Expired"
         )
     except jwt.InvalidTokenError as e:
-        _log.warning(f"JWT decode failed: invalid token - {e}")
+        _log.warning("JWT decode failed: invalid token - %s", e)
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid Token"
         )
@@ -148,7 +157,7 @@ def decode_jwt(token: str) -> dict[str, str]:
 @dataclass(frozen=True, slots=True)
 class Principal:
     sub: str
-    scopes: set[str]
+    scopes: frozenset[str]
     claims: dict[str, Any]
     token: str | None = None
 
@@ -177,7 +186,7 @@ class CurrentPrincipal:
             raise HTTPException(status_code=401, detail="Invalid token")
 
         sub = claims.get("sub", "unknown")
-        token_scopes = set(claims.get("scopes", "").split())
+        token_scopes = frozenset(claims.get("scopes", "").split())
 
         if wanted_scopes.scopes:
             required = set(wanted_scopes.scopes)
@@ -1,6 +1,9 @@
+import asyncio
 import logging
 from contextlib import asynccontextmanager
 from fastapi import FastAPI
+from fastapi.responses import ORJSONResponse
+from sqlalchemy import text
 
 from cctracker.server.config import config
 from cctracker.server.api.auth import api_router as auth_router
@@ -23,12 +26,26 @@ async def lifespan(app: FastAPI):
         aiosqlite_logger.setLevel(logging.INFO)
         db_engine = setup_db("sqlite+aiosqlite:///cctracker_dev.db")
     else:
-        db_engine = setup_db(str(config.db_conn_string))
+        db_engine = setup_db(
+            str(config.db_conn_string),
+            pool_size=config.db_pool_size,
+            max_overflow=config.db_max_overflow,
+            pool_recycle=config.db_pool_recycle,
+        )
 
     async with db_engine.begin() as conn:
         log.info("Configuring Database")
         await conn.run_sync(models.Base.metadata.create_all)
 
+    if not config.dev_db:
+        log.info("Warming database connection pool")
+
+        async def _ping():
+            async with db_engine.connect() as conn:
+                await conn.execute(text("SELECT 1"))
+
+        await asyncio.gather(*(_ping() for _ in range(config.db_pool_size)))
+
     _minio_client = setup_minio(
         config.minio_url,
         config.minio_access_key,
@@ -47,7 +64,7 @@ async def lifespan(app: FastAPI):
     log.info("Goodbye")
 
 
-app = FastAPI(lifespan=lifespan)
+app = FastAPI(lifespan=lifespan, default_response_class=ORJSONResponse)
 
 app.include_router(auth_router)
 app.include_router(event_router)
@@ -1,40 +1,64 @@
+import asyncio
 from dataclasses import dataclass
 from typing import Annotated
 
 from fastapi import Depends, HTTPException, status
 from fastapi.security import HTTPAuthorizationCredentials, SecurityScopes
-from sqlalchemy import select
+from sqlalchemy import bindparam, select
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
 from cctracker.db import with_db, models
 from cctracker.log import get_logger
 from cctracker.server.auth import CurrentPrincipal, Principal
+from cctracker.server.config import config
 
 log = get_logger(__name__)
 
 
-async def with_event(
-    eventId: str, db: Annotated[AsyncSession, Depends(with_db)]
-) -> models.Event:
-    stmt = (
-        select(models.Event)
-        .where(models.Event.slug == eventId)
-        .options(
-            selectinload(models.Event.open_times),
-            selectinload(models.Event.seats).selectinload(models.Seat.assignments),
-            selectinload(models.Event.artists),
-            selectinload(models.Event.owner),
-            selectinload(models.Event.editors),
-            selectinload(models.Event.assignments),
-        )
-    )
-    event = await db.scalar(stmt)
-    if event is None:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND, detail=f"{eventId} not found"
+# Loader option per relationship name; WithEvent picks from these so each
+# endpoint only pays for the relationships it actually reads
+_EVENT_LOADS = {
+    "open_times": selectinload(models.Event.open_times),
+    "seats": selectinload(models.Event.seats).selectinload(models.Seat.assignments),
+    "artists": selectinload(models.Event.artists),
+    "owner": selectinload(models.Event.owner),
+    "editors": selectinload(models.Event.editors),
+    "assignments": selectinload(models.Event.assignments),
+}
+
+
+class WithEvent:
+    """
+    Dependency that loads an event by slug with the named relationships
+    eagerly loaded. The statement is built once per load spec; every
+    request reuses the cached compiled form instead of rebuilding the
+    select+options tree.
+    """
+
+    def __init__(self, *load: str):
+        self._stmt = (
+            select(models.Event)
+            .where(models.Event.slug == bindparam("slug"))
+            .options(*(_EVENT_LOADS[name] for name in load))
         )
-    return event
+
+    async def __call__(
+        self, eventId: str, db: Annotated[AsyncSession, Depends(with_db)]
+    ) -> models.Event:
+        event = await db.scalar(self._stmt, {"slug": eventId})
+        if event is None:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND, detail=f"{eventId} not found"
+            )
+        return event
+
+
+# Full graph; the safe default for endpoints that touch derived properties
+with_event = WithEvent(*_EVENT_LOADS)
+
+# Bare row; for dependencies that refresh what they need themselves
+with_event_row = WithEvent()
 
 
 @dataclass(frozen=True, slots=True)
@@ -79,17 +103,47 @@ class CurrentUser:
 OptionalUser = CurrentUser(optional=True)
 
 
+class WriteLimiter:
+    """
+    Dependency that bounds concurrent write handlers.
+
+    A burst of editor requests can start far more coroutines than the DB
+    pool has connections, stalling everything behind pool checkout. Cap
+    write concurrency near the pool size and shed the excess with a 503
+    instead of queueing indefinitely.
+    """
+
+    def __init__(self, limit: int):
+        self._sem = asyncio.Semaphore(limit)
+
+    async def __call__(self):
+        try:
+            await asyncio.wait_for(self._sem.acquire(), timeout=0.05)
+        except TimeoutError:
+            raise HTTPException(
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                detail="Server busy, please retry",
+            )
+        try:
+            yield
+        finally:
+            self._sem.release()
+
+
+write_limiter = WriteLimiter(config.db_pool_size)
+
+
 async def require_event_editor(
     event: Annotated[models.Event, Depends(with_event)],
-    user_data: Annotated[models.UserData, Depends(CurrentUser)],
+    user_data: Annotated[models.UserData, Depends(CurrentUser())],
 ) -> models.Event:
     """
     Dependency that verifies user can edit the event and returns the event.
     Raises 404 if event not found, 401 if user lacks permission.
     """
 
-    if event.slug not in [e.slug for e in user_data.editable_events]:
-        log.debug(f"{user_data.username} cannot edit {event.slug}")
+    if event.slug not in user_data.editable_event_slugs:
+        log.debug("%s cannot edit %s", user_data.username, event.slug)
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="You do not have permission to edit this event.",
@@ -1,13 +1,14 @@
 from typing import Annotated
 
 from fastapi import Depends
+from sqlalchemy import select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 from valkey.asyncio import Valkey
 
 from cctracker.cache import with_vk
 from cctracker.db import models, with_db
 from cctracker.log import get_logger
-from cctracker.server.helpers import with_event
+from cctracker.server.helpers import with_event_row
 
 log = get_logger(__name__)
 
@@ -15,11 +16,16 @@ _EXPIRATION_CHECK_INTERVAL = 30  # seconds
 
 
 async def expire_stale_seats(
-    event: Annotated[models.Event, Depends(with_event)],
+    event: Annotated[models.Event, Depends(with_event_row)],
     db: Annotated[AsyncSession, Depends(with_db)],
     vk: Annotated[Valkey, Depends(with_vk)],
 ) -> None:
-    """Check and expire seats using distributed lock"""
+    """Check and expire seats using distributed lock.
+
+    Only needs the bare event row: staleness is computed from the active
+    assignments' started_at plus the event's seatDuration and the rows are
+    ended with one UPDATE, same as the bulk sweep.
+    """
     lock_key = f"seat_expiration_lock:{event.id}"
 
     # Try to acquire lock - only succeeds if key doesn't exist
@@ -28,34 +34,109 @@ async def expire_stale_seats(
 
     if not acquired:
         log.debug(
-            f"Expiration check already running or recently completed for event {event.slug}"
+            "Expiration check already running or recently completed for event %s",
+            event.slug,
         )
         return
 
-    await db.refresh(event, ["seats", "artists", "assignments"])
-
-    expired = 0
     utc_now = models.utcnow()
 
-    for seat in event.seats:
-        current_seat_assignment = seat.current_assignment
-        if current_seat_assignment is None:
-            continue
+    rows = await db.execute(
+        select(models.SeatAssignment.id, models.SeatAssignment.started_at).where(
+            models.SeatAssignment.ended_at.is_(None),
+            models.SeatAssignment.event_id == event.id,
+        )
+    )
 
-        time_remaining = current_seat_assignment.artist.time_remaining
-        if time_remaining is None:
-            log.error(
-                f"Active artist {current_seat_assignment.artist.slug} has no time_remaining - database inconsistency"
-            )
-            continue
+    expired_ids = [
+        assignment_id
+        for assignment_id, started_at in rows
+        if (utc_now - started_at).total_seconds() >= event.seatDuration * 60
+    ]
+
+    if expired_ids:
+        await db.execute(
+            update(models.SeatAssignment)
+            .where(models.SeatAssignment.id.in_(expired_ids))
+            .values(ended_at=utc_now)
+            .execution_options(synchronize_session=False)
+        )
+        await db.commit()
+        log.info("Expired %s seats in event %s", len(expired_ids), event.slug)
 
-        if time_remaining <= 0:
-            current_seat_assignment.ended_at = utc_now
-            expired += 1
-            log.debug(
-                f"Expired seat for {current_seat_assignment.artist.slug} in event {event.slug}"
+
+async def expire_stale_seats_bulk(
+    candidate_ids: list[int], db: AsyncSession, vk: Valkey
+) -> None:
+    """Sweep several events in one pass.
+
+    Locks are acquired for all events in a single pipeline and the stale
+    assignments are ended with one UPDATE, instead of a lock/refresh/commit
+    round trip per event. Takes bare event ids so callers can run the sweep
+    before loading anything heavier.
+    """
+    if not candidate_ids:
+        return
+
+    async with vk.pipeline(transaction=False) as pipe:
+        for event_id in candidate_ids:
+            pipe.set(
+                f"seat_expiration_lock:{event_id}",
+                "1",
+                nx=True,
+                ex=_EXPIRATION_CHECK_INTERVAL,
             )
+        acquired = await pipe.execute()
 
-    if expired:
+    event_ids = [event_id for event_id, got in zip(candidate_ids, acquired) if got]
+    if not event_ids:
+        log.debug("Expiration checks already running for all requested events")
+        return
+
+    utc_now = models.utcnow()
+
+    rows = await db.execute(
+        select(
+            models.SeatAssignment.id,
+            models.SeatAssignment.started_at,
+            models.Event.seatDuration,
+        )
+        .join(models.Event, models.SeatAssignment.event_id == models.Event.id)
+        .where(
+            models.SeatAssignment.ended_at.is_(None),
+            models.SeatAssignment.event_id.in_(event_ids),
+        )
+    )
+
+    expired_ids = [
+        assignment_id
+        for assignment_id, started_at, duration in rows
+        if (utc_now - started_at).total_seconds() >= duration * 60
+    ]
+
+    if expired_ids:
+        await db.execute(
+            update(models.SeatAssignment)
+            .where(models.SeatAssignment.id.in_(expired_ids))
+            .values(ended_at=utc_now)
+            .execution_options(synchronize_session=False)
+        )
         await db.commit()
-        log.info(f"Expired {expired} seats in event {event.slug}")
+        log.info(
+            "Expired %s seats across %s events", len(expired_ids), len(event_ids)
+        )
+
+
+async def expire_stale_seats_background(event_slug: str) -> None:
+    """Run the expiration sweep outside the request with its own session.
+
+    Request-scoped sessions are torn down before background tasks run, so
+    this opens a fresh one via the with_db generator.
+    """
+    vk = with_vk()
+    try:
+        async for db in with_db():
+            event = await with_event_row(event_slug, db)
+            await expire_stale_seats(event, db, vk)
+    except Exception as e:
+        log.warning("Background seat expiration failed for %s: %s", event_slug, e)
@@ -1,3 +1,8 @@
-from cctracker.cache.core import setup_valkey, with_vk
+from cctracker.cache.core import (
+    artist_cache_key,
+    artist_details_cache_key,
+    setup_valkey,
+    with_vk,
+)
 
-__all__ = ["setup_valkey", "with_vk"]
+__all__ = ["artist_cache_key", "artist_details_cache_key", "setup_valkey", "with_vk"]
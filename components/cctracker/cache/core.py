@@ -15,6 +15,24 @@ class ArtistSeatStatus(StrEnum):
     inactive = auto()
 
 
+def artist_cache_key(event_slug: str, artist_id: str) -> str:
+    """Key for an artist's event-scoped hash.
+
+    Hash-tagged on the event slug so all artist entries for one event land
+    on the same cluster slot and can be pipelined together.
+    """
+    return f"{{{event_slug}}}:artist:{artist_id}"
+
+
+def artist_details_cache_key(artist_id: str) -> str:
+    """Key for the cached public artist details payload.
+
+    Shared so every endpoint that mutates an artist can evict the same key
+    the read-through cache populates.
+    """
+    return f"artist:{artist_id}"
+
+
 def setup_valkey(conn_string: str) -> Valkey:
     global _client
 
@@ -24,7 +42,15 @@ def setup_valkey(conn_string: str) -> Valkey:
         )
         return _client
 
-    _client = Valkey.from_url(conn_string)
+    # One long-lived client per worker; the asyncio client multiplexes
+    # concurrent commands over its internal connection pool, so per-request
+    # connect/close overhead is avoided entirely.
+    _client = Valkey.from_url(
+        conn_string,
+        max_connections=64,
+        socket_keepalive=True,
+        health_check_interval=30,
+    )
 
     return _client
 
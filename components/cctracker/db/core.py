@@ -8,7 +8,13 @@ _log = get_logger(__name__)
 _engine: AsyncEngine | None = None
 _sessionMaker: async_sessionmaker[AsyncSession] | None = None
 
-def setup_db(conn_string: str) -> AsyncEngine:
+def setup_db(
+    conn_string: str,
+    pool_size: int | None = None,
+    max_overflow: int | None = None,
+    pool_recycle: int | None = None,
+    pool_pre_ping: bool = True,
+) -> AsyncEngine:
     global _engine
     global _sessionMaker
 
@@ -18,7 +24,22 @@ def setup_db(conn_string: str) -> AsyncEngine:
 
     _log.debug("Setting Up DB Connection")
 
-    _engine = create_async_engine(conn_string)
+    # Only pass pool sizing when configured; sqlite (dev_db) rejects these args.
+    engine_kwargs: dict = {
+        "pool_pre_ping": pool_pre_ping,
+        # keep compiled forms of the hot statements around
+        "query_cache_size": 1200,
+    }
+    if pool_size is not None:
+        engine_kwargs["pool_size"] = pool_size
+        # hand back the most recently used connection so the hot ones stay warm
+        engine_kwargs["pool_use_lifo"] = True
+    if max_overflow is not None:
+        engine_kwargs["max_overflow"] = max_overflow
+    if pool_recycle is not None:
+        engine_kwargs["pool_recycle"] = pool_recycle
+
+    _engine = create_async_engine(conn_string, **engine_kwargs)
     _sessionMaker = async_sessionmaker(_engine, expire_on_commit=False, autoflush=False)
 
     _log.debug("DB Connection Success")
@@ -9,6 +9,7 @@ from sqlalchemy import (
     ForeignKey,
     Integer,
     String,
+    TypeDecorator,
     UniqueConstraint,
 )
 from sqlalchemy.ext.asyncio import AsyncAttrs
@@ -20,6 +21,28 @@ def utcnow() -> datetime:
     return datetime.now(timezone.utc)
 
 
+class TZDateTime(TypeDecorator):
+    """DateTime that always round-trips timezone-aware.
+
+    Postgres preserves tzinfo, but the sqlite dev backend stores wall time
+    and hands back naive datetimes; normalize to UTC on write and re-attach
+    UTC on read so comparisons and response models never see naive values.
+    """
+
+    impl = DateTime(timezone=True)
+    cache_ok = True
+
+    def process_bind_param(self, value: datetime | None, dialect):
+        if value is not None and value.tzinfo is not None:
+            value = value.astimezone(timezone.utc)
+        return value
+
+    def process_result_value(self, value: datetime | None, dialect):
+        if value is not None and value.tzinfo is None:
+            value = value.replace(tzinfo=timezone.utc)
+        return value
+
+
 class Base(AsyncAttrs, DeclarativeBase):
     """Base class for all ORM models."""
 
@@ -124,8 +147,8 @@ class OpenTime(Base):
     event_id: Mapped[int] = mapped_column(ForeignKey("events.id", ondelete="CASCADE"))
     event: Mapped["Event"] = relationship(back_populates="open_times")
 
-    open_time: Mapped[datetime] = mapped_column(DateTime(timezone=True))
-    close_time: Mapped[datetime] = mapped_column(DateTime(timezone=True))
+    open_time: Mapped[datetime] = mapped_column(TZDateTime())
+    close_time: Mapped[datetime] = mapped_column(TZDateTime())
 
     @property
     def open_now(self) -> bool:
@@ -190,6 +213,8 @@ class Artist(Base):
     coms_remaining: Mapped[int | None] = mapped_column(
         Integer(), nullable=True, default=None
     )
+    # Stable prefix for anonymous profile uploads, derived once at creation
+    temp_object_prefix: Mapped[str] = mapped_column(String(16), default="")
 
     __table_args__ = (
         UniqueConstraint("event_id", "slug", name="uq_artist_slug_event"),
@@ -255,11 +280,11 @@ class SeatAssignment(Base):
     )
 
     started_at: Mapped[datetime] = mapped_column(
-        DateTime(timezone=True),
+        TZDateTime(),
         default=utcnow,  # IMPORTANT: callable default
     )
     ended_at: Mapped[datetime | None] = mapped_column(
-        DateTime(timezone=True), nullable=True, default=None
+        TZDateTime(), nullable=True, default=None
     )
 
     event: Mapped["Event"] = relationship(back_populates="assignments")
@@ -324,6 +349,11 @@ class UserData(Base):
         passive_deletes=True,
     )
 
+    @property
+    def editable_event_slugs(self) -> frozenset[str]:
+        """Slugs of events this user can edit, for O(1) membership checks."""
+        return frozenset(event.slug for event in self.editable_events)
+
 
 class UserArtistData(Base):
     __tablename__ = "saved_artists"
@@ -361,7 +391,7 @@ class PermissionRequest(Base):
     granted_by: Mapped[str] = mapped_column(String())
 
     requested_at: Mapped[datetime] = mapped_column(
-        DateTime(timezone=True), default=utcnow
+        TZDateTime(), default=utcnow
     )
     reason: Mapped[str] = mapped_column(String(512), default="")
 
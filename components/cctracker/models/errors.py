@@ -1,5 +1,5 @@
 from enum import StrEnum, auto
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 
 
 class StandardErrorTypes(StrEnum):
@@ -16,6 +16,9 @@ class StandardErrorTypes(StrEnum):
 
 
 class StandardError(BaseModel):
+    # frozen so the common parameterless errors can be built once and reused
+    model_config = ConfigDict(frozen=True)
+
     tag: str = "Standard Error"
     code: int
     type: StandardErrorTypes
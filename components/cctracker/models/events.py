@@ -39,6 +39,39 @@ class EventDetails(BaseModel):
     open: bool
     openTimes: list[OpenTimes] = []
 
+    @classmethod
+    def from_orm_event(
+        cls,
+        event,
+        *,
+        startDate: datetime | None,
+        endDate: datetime | None,
+        seats: int,
+        seatsAvailable: int,
+        open: bool,
+        openTimes: list[OpenTimes] | None = None,
+    ) -> "EventDetails":
+        """Build a response from a DB event without re-validating its fields.
+
+        The identity fields come straight off the row; everything derived
+        (dates, counts, open flag) is passed in explicitly so no lazy
+        relationship access can sneak in. model_construct skips per-field
+        validation, which the endpoints' response models re-check anyway.
+        """
+        return cls.model_construct(
+            name=event.name,
+            slug=event.slug,
+            hostedBy=event.hostedBy,
+            hostedByUrl=HttpUrl(event.hostedByUrl),
+            startDate=startDate,
+            endDate=endDate,
+            seats=seats,
+            seatsAvailable=seatsAvailable,
+            open=open,
+            duration=event.seatDuration,
+            openTimes=openTimes if openTimes is not None else [],
+        )
+
 
 class EventList(BaseModel):
     current: list[EventDetails] = []
@@ -1,19 +1,116 @@
 import logging
+from datetime import datetime, timedelta, timezone
+
 from httpx import ASGITransport, AsyncClient
 import pytest_asyncio
 import pytest
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine, async_sessionmaker
 from fastapi.testclient import TestClient
 
+from cctracker.cache import with_vk
+from cctracker.db import with_db
+from cctracker.server.config import config
 from cctracker.server.core import app
 from cctracker.log import get_logger
 from cctracker.server.auth import create_dev_token
-from cctracker.db.models import Base
+from cctracker.db.models import Base, Event, OpenTime, Seat, UserData
 
 aiosqlite_logger = get_logger("aiosqlite")
 aiosqlite_logger.setLevel(logging.INFO)
 
 
+class FakeValkeyPipeline:
+    """Queues commands against a FakeValkey and replays them on execute."""
+
+    def __init__(self, client):
+        self._client = client
+        self._ops = []
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    def __getattr__(self, name):
+        method = getattr(self._client, name)
+
+        def queue(*args, **kwargs):
+            self._ops.append((method, args, kwargs))
+            return self
+
+        return queue
+
+    async def execute(self):
+        results = [await method(*args, **kwargs) for method, args, kwargs in self._ops]
+        self._ops = []
+        return results
+
+
+class FakeValkey:
+    """In-memory stand-in for the async Valkey client.
+
+    Stores and returns bytes, like the real client does without
+    decode_responses, so tests see the same types the server does.
+    """
+
+    def __init__(self):
+        self.store = {}
+        self.hashes = {}
+        self.ttls = {}
+
+    @staticmethod
+    def _encode(value):
+        if isinstance(value, bytes):
+            return value
+        return str(value).encode()
+
+    async def get(self, key):
+        return self.store.get(key)
+
+    async def set(self, key, value, ex=None, nx=False):
+        if nx and key in self.store:
+            return None
+        self.store[key] = self._encode(value)
+        if ex is not None:
+            self.ttls[key] = ex
+        return True
+
+    async def delete(self, *keys):
+        removed = 0
+        for key in keys:
+            removed += key in self.store or key in self.hashes
+            self.store.pop(key, None)
+            self.hashes.pop(key, None)
+            self.ttls.pop(key, None)
+        return removed
+
+    async def hset(self, name, key=None, value=None, mapping=None):
+        entry = self.hashes.setdefault(name, {})
+        if key is not None:
+            entry[key] = self._encode(value)
+        if mapping:
+            for field, field_value in mapping.items():
+                entry[field] = self._encode(field_value)
+        return len(entry)
+
+    async def hget(self, name, key):
+        return self.hashes.get(name, {}).get(key)
+
+    async def hmget(self, name, *keys):
+        entry = self.hashes.get(name, {})
+        return [entry.get(key) for key in keys]
+
+    async def expire(self, name, seconds):
+        if name in self.store or name in self.hashes:
+            self.ttls[name] = seconds
+            return True
+        return False
+
+    def pipeline(self, transaction=True):
+        return FakeValkeyPipeline(self)
+
+
 
 @pytest_asyncio.fixture
 async def db_session():
@@ -45,3 +142,77 @@ async def httpx_client():
         transport=ASGITransport(app=app), base_url="http://test"
     ) as ac:
         yield ac
+
+
+@pytest.fixture
+def fake_valkey():
+    return FakeValkey()
+
+
+@pytest_asyncio.fixture
+async def api_session_maker():
+    """Session maker bound to a fresh in-memory database with tables created."""
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+
+    yield async_sessionmaker(engine, expire_on_commit=False, autoflush=False)
+
+    await engine.dispose()
+
+
+@pytest_asyncio.fixture
+async def api_client(api_session_maker, fake_valkey, monkeypatch):
+    """Client with the app's DB and Valkey dependencies overridden.
+
+    dev_mode is enabled so the dev tokens from auth_headers decode.
+    """
+    monkeypatch.setattr(config, "dev_mode", True)
+
+    async def _override_db():
+        async with api_session_maker() as session:
+            try:
+                yield session
+                await session.flush()
+            except Exception:
+                await session.rollback()
+                raise
+
+    app.dependency_overrides[with_db] = _override_db
+    app.dependency_overrides[with_vk] = lambda: fake_valkey
+
+    async with AsyncClient(
+        transport=ASGITransport(app=app), base_url="http://test"
+    ) as ac:
+        yield ac
+
+    app.dependency_overrides.clear()
+
+
+@pytest_asyncio.fixture
+async def seeded_event(api_session_maker):
+    """A currently-open event with three seats, owned and editable by test_user."""
+    now = datetime.now(timezone.utc)
+    async with api_session_maker() as session:
+        user = UserData(username="test_user")
+        event = Event(
+            slug="seeded-event",
+            name="Seeded Event",
+            createdBy="test_user",
+            hostedBy="Test Host",
+            hostedByUrl="https://example.com",
+            seatDuration=60,
+            dwellPeriod=0,
+            owner=user,
+        )
+        event.editors.append(user)
+        event.open_times.append(
+            OpenTime(
+                open_time=now - timedelta(hours=1),
+                close_time=now + timedelta(hours=8),
+            )
+        )
+        event.seats = [Seat(seat_number=i) for i in range(1, 4)]
+        session.add(event)
+        await session.commit()
+        return event
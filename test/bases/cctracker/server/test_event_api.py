@@ -205,3 +205,226 @@ async def test_list_events_structure(httpx_client: AsyncClient, sample_current_e
     assert "seats" in event
     assert "seatsAvailable" in event
     assert "open" in event
+
+
+@pytest_asyncio.fixture
+async def editable_event(api_session_maker, sample_future_open_times):
+    """A not-yet-open event owned and editable by test_user, with three seats."""
+    from cctracker.db.models import UserData
+
+    async with api_session_maker() as session:
+        user = UserData(username="test_user")
+        event = Event(
+            slug="editable-event",
+            name="Editable Event",
+            createdBy="test_user",
+            hostedBy="Test Host",
+            hostedByUrl="https://example.com",
+            seatDuration=60,
+            dwellPeriod=1,
+            owner=user,
+        )
+        event.editors.append(user)
+        for time_pair in sample_future_open_times:
+            event.open_times.append(
+                OpenTime(open_time=time_pair.open_time, close_time=time_pair.close_time)
+            )
+        event.seats = [Seat(seat_number=i) for i in range(1, 4)]
+        session.add(event)
+        await session.commit()
+        return event
+
+
+def _update_payload(event, sample_future_open_times, seats):
+    return {
+        "name": event.name,
+        "slug": event.slug,
+        "hostedBy": event.hostedBy,
+        "hostedByUrl": event.hostedByUrl,
+        "seats": seats,
+        "duration": event.seatDuration,
+        "dwellPeriod": event.dwellPeriod,
+        "openTimes": [
+            {
+                "open_time": t.open_time.isoformat(),
+                "close_time": t.close_time.isoformat(),
+            }
+            for t in sample_future_open_times
+        ],
+    }
+
+
+@pytest.mark.asyncio
+async def test_update_event_grow_preserves_existing_seats(
+    api_client, api_session_maker, auth_headers, editable_event, sample_future_open_times
+):
+    """Growing the seat count keeps the original seat rows"""
+    from sqlalchemy import select
+
+    async with api_session_maker() as session:
+        ids_before = set(
+            await session.scalars(
+                select(Seat.id).where(Seat.event_id == editable_event.id)
+            )
+        )
+
+    response = await api_client.post(
+        f"/event/{editable_event.slug}",
+        json=_update_payload(editable_event, sample_future_open_times, seats=5),
+        headers=auth_headers,
+    )
+    assert response.status_code == 200
+    assert response.json()["seats"] == 5
+
+    async with api_session_maker() as session:
+        ids_after = set(
+            await session.scalars(
+                select(Seat.id).where(Seat.event_id == editable_event.id)
+            )
+        )
+    assert len(ids_after) == 5
+    assert ids_before <= ids_after
+
+
+@pytest.mark.asyncio
+async def test_update_event_shrink_keeps_low_seats_and_history(
+    api_client, api_session_maker, auth_headers, editable_event, sample_future_open_times
+):
+    """Shrinking deletes only the seats above the new count"""
+    from sqlalchemy import select
+
+    from cctracker.db.models import SeatAssignment, utcnow
+
+    async with api_session_maker() as session:
+        seat_one = await session.scalar(
+            select(Seat).where(
+                Seat.event_id == editable_event.id, Seat.seat_number == 1
+            )
+        )
+        artist = Artist(
+            event_id=editable_event.id, name="Seated Artist", slug="seated-artist"
+        )
+        session.add(artist)
+        await session.flush()
+        session.add(
+            SeatAssignment(
+                event_id=editable_event.id,
+                seat_id=seat_one.id,
+                artist_id=artist.id,
+                ended_at=utcnow(),
+            )
+        )
+        await session.commit()
+        seat_one_id = seat_one.id
+
+    response = await api_client.post(
+        f"/event/{editable_event.slug}",
+        json=_update_payload(editable_event, sample_future_open_times, seats=2),
+        headers=auth_headers,
+    )
+    assert response.status_code == 200
+
+    async with api_session_maker() as session:
+        seats = (
+            await session.scalars(
+                select(Seat).where(Seat.event_id == editable_event.id)
+            )
+        ).all()
+        assignments = (
+            await session.scalars(
+                select(SeatAssignment).where(
+                    SeatAssignment.event_id == editable_event.id
+                )
+            )
+        ).all()
+
+    assert sorted(s.seat_number for s in seats) == [1, 2]
+    assert seat_one_id in {s.id for s in seats}
+    assert len(assignments) == 1
+
+
+@pytest.mark.asyncio
+async def test_editor_add_list_remove_flow(
+    api_client, api_session_maker, auth_headers, editable_event
+):
+    """Editors can be added, listed, and removed by the owner"""
+    from cctracker.db.models import UserData
+
+    async with api_session_maker() as session:
+        session.add(UserData(username="other_user"))
+        await session.commit()
+
+    url = f"/event/{editable_event.slug}/editors"
+
+    response = await api_client.post(
+        url, json={"username": "other_user"}, headers=auth_headers
+    )
+    assert response.status_code == 200
+
+    response = await api_client.get(url, headers=auth_headers)
+    assert response.status_code == 200
+    usernames = {editor["username"] for editor in response.json()}
+    assert usernames == {"test_user", "other_user"}
+
+    response = await api_client.request(
+        "DELETE",
+        f"{url}/other_user",
+        json={"username": "other_user"},
+        headers=auth_headers,
+    )
+    assert response.status_code == 200
+
+    response = await api_client.get(url, headers=auth_headers)
+    assert {editor["username"] for editor in response.json()} == {"test_user"}
+
+    # removing again is a 404, as is adding someone who doesn't exist
+    response = await api_client.request(
+        "DELETE",
+        f"{url}/other_user",
+        json={"username": "other_user"},
+        headers=auth_headers,
+    )
+    assert response.status_code == 404
+
+    response = await api_client.post(
+        url, json={"username": "nobody"}, headers=auth_headers
+    )
+    assert response.status_code == 404
+
+
+@pytest.mark.asyncio
+async def test_event_detail_etag_roundtrip(api_client, editable_event):
+    """A matching If-None-Match short-circuits the detail view to 304"""
+    response = await api_client.get(f"/event/{editable_event.slug}")
+    assert response.status_code == 200
+    etag = response.headers["etag"]
+    assert etag.startswith('W/"')
+
+    response = await api_client.get(
+        f"/event/{editable_event.slug}", headers={"If-None-Match": etag}
+    )
+    assert response.status_code == 304
+    assert response.content == b""
+
+
+@pytest.mark.asyncio
+async def test_event_list_cached_and_invalidated_on_write(
+    api_client, fake_valkey, auth_headers, editable_event, sample_future_open_times
+):
+    """The list body is cached with a short TTL and evicted by event writes"""
+    response = await api_client.get("/event/list")
+    assert response.status_code == 200
+    assert "events:list:v1" in fake_valkey.store
+    assert fake_valkey.ttls["events:list:v1"] == 5
+
+    # second call is served from the cached body
+    cached = await api_client.get("/event/list")
+    assert cached.content == response.content
+
+    update = await api_client.post(
+        f"/event/{editable_event.slug}",
+        json=_update_payload(editable_event, sample_future_open_times, seats=4),
+        headers=auth_headers,
+    )
+    assert update.status_code == 200
+    assert "events:list:v1" not in fake_valkey.store
@@ -0,0 +1,171 @@
+from uuid import uuid4
+
+import pytest
+import pytest_asyncio
+from httpx import AsyncClient
+from sqlalchemy import select
+
+from cctracker.cache.core import artist_cache_key
+from cctracker.db.models import Artist, SeatAssignment
+from cctracker.server.auth import EventArtistToken, sign
+
+
+@pytest_asyncio.fixture
+async def seeded_artist(api_session_maker, seeded_event):
+    """An artist registered to the seeded event but not yet seated."""
+    async with api_session_maker() as session:
+        artist = Artist(
+            event_id=seeded_event.id, name="Test Artist", slug="test-artist"
+        )
+        session.add(artist)
+        await session.commit()
+        return artist
+
+
+def _claim_token(event_slug: str, artist_slug: str, token_uuid) -> str:
+    return sign(
+        EventArtistToken(
+            event_id=event_slug, artist_id=artist_slug, uuid=token_uuid
+        ),
+        salt=event_slug,
+    )
+
+
+@pytest.mark.asyncio
+async def test_new_artist_token_hash_gets_ttl(
+    api_client: AsyncClient, fake_valkey, auth_headers, seeded_event
+):
+    """Creating an artist writes the token hash with the 7-day expiry"""
+    response = await api_client.post(
+        f"/event/{seeded_event.slug}/artist/new",
+        json={
+            "name": "New Artist",
+            "slug": "new-artist",
+            "eventId": "seeded-event",
+            "seat": 1,
+        },
+        headers=auth_headers,
+    )
+
+    assert response.status_code == 200
+    assert "token" in response.json()
+
+    cache_key = artist_cache_key(seeded_event.slug, "new-artist")
+    assert await fake_valkey.hget(cache_key, "token_uuid") is not None
+    assert fake_valkey.ttls[cache_key] == 86400 * 7
+
+
+@pytest.mark.asyncio
+async def test_claim_with_valid_token_assigns_seat(
+    api_client: AsyncClient,
+    fake_valkey,
+    api_session_maker,
+    seeded_event,
+    seeded_artist,
+):
+    """A valid token claims the cached seat and sets the artist cookie"""
+    token_uuid = uuid4()
+    cache_key = artist_cache_key(seeded_event.slug, seeded_artist.slug)
+    await fake_valkey.hset(
+        cache_key,
+        mapping={
+            "status": "pending_creation",
+            "seat": 2,
+            "token_uuid": token_uuid.hex,
+            "locked": "0",
+        },
+    )
+    token = _claim_token(seeded_event.slug, seeded_artist.slug, token_uuid)
+
+    response = await api_client.get(
+        f"/event/{seeded_event.slug}/artist/claim", params={"token": token}
+    )
+
+    assert response.status_code == 200
+    assert "event_artist_token" in response.cookies
+
+    async with api_session_maker() as session:
+        assignment = await session.scalar(
+            select(SeatAssignment).where(
+                SeatAssignment.artist_id == seeded_artist.id,
+                SeatAssignment.ended_at.is_(None),
+            )
+        )
+    assert assignment is not None
+
+    assert await fake_valkey.hget(cache_key, "status") == b"active"
+
+
+@pytest.mark.asyncio
+async def test_claim_with_stale_token_uuid_is_rejected(
+    api_client: AsyncClient, fake_valkey, seeded_event, seeded_artist
+):
+    """A token whose uuid no longer matches the cache is rejected with 401"""
+    cache_key = artist_cache_key(seeded_event.slug, seeded_artist.slug)
+    await fake_valkey.hset(
+        cache_key,
+        mapping={
+            "status": "pending_creation",
+            "seat": 2,
+            "token_uuid": uuid4().hex,
+            "locked": "0",
+        },
+    )
+    token = _claim_token(seeded_event.slug, seeded_artist.slug, uuid4())
+
+    response = await api_client.get(
+        f"/event/{seeded_event.slug}/artist/claim", params={"token": token}
+    )
+
+    assert response.status_code == 401
+
+
+@pytest.mark.asyncio
+async def test_claim_without_cache_entry_is_404(
+    api_client: AsyncClient, seeded_event, seeded_artist
+):
+    """A token with no cache entry behind it cannot claim a seat"""
+    token = _claim_token(seeded_event.slug, seeded_artist.slug, uuid4())
+
+    response = await api_client.get(
+        f"/event/{seeded_event.slug}/artist/claim", params={"token": token}
+    )
+
+    assert response.status_code == 404
+
+
+@pytest.mark.asyncio
+async def test_claim_falls_back_to_legacy_cache_key(
+    api_client: AsyncClient,
+    fake_valkey,
+    api_session_maker,
+    seeded_event,
+    seeded_artist,
+):
+    """Tokens issued before the key/uuid format change can still claim"""
+    token_uuid = uuid4()
+    await fake_valkey.hset(
+        f"{seeded_event.slug}:{seeded_artist.slug}",
+        mapping={
+            "status": "pending_creation",
+            "seat": 3,
+            "token_uuid": str(token_uuid),
+            "locked": "0",
+        },
+    )
+    token = _claim_token(seeded_event.slug, seeded_artist.slug, token_uuid)
+
+    response = await api_client.get(
+        f"/event/{seeded_event.slug}/artist/claim", params={"token": token}
+    )
+
+    assert response.status_code == 200
+
+    async with api_session_maker() as session:
+        assignment = await session.scalar(
+            select(SeatAssignment).where(
+                SeatAssignment.artist_id == seeded_artist.id,
+                SeatAssignment.ended_at.is_(None),
+            )
+        )
+    assert assignment is not None